@@ -49,8 +49,8 @@ def build_state(allow_guess: bool = True):
     global last_guess_name
 
     try:
-        # Basic stats
-        entropy = ai.entropy(ai.probabilities)
+        # Basic stats (the per-turn snapshot is shared with should_make_guess/get_best_guess)
+        entropy = ai.snapshot()['entropy']
         top_candidates = [
             {"name": name, "probability": float(prob)}
             for name, prob in ai.get_top_characters(8)
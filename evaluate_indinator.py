@@ -19,7 +19,7 @@ Outputs:
 from pathlib import Path
 import csv
 import random
-import matplotlib.pyplot as plt
+from itertools import accumulate
 from indinator import AkinatorAI
 
 
@@ -28,6 +28,16 @@ from indinator import AkinatorAI
 NUM_GAMES = None            # number of games to simulate (set None to use all chars)
 MAX_QUESTIONS = 25        # hard cap on questions per game
 CONFIDENCE_THRESHOLD = 0.85
+SEED = None               # set an int for reproducible target sampling and answers
+
+# Dedicated generator for answer noise and target sampling (keeps the global
+# random state untouched)
+_rng = random.Random(SEED)
+
+# Graded answer codes and cumulative weights for sample_human_like_answer
+ANSWER_CODES = (2, 1, 0, -1, -2)    # Yes, ProbYes, Maybe, ProbNo, No
+HAS_TRAIT_CUM_WEIGHTS = tuple(accumulate((0.55, 0.25, 0.15, 0.03, 0.02)))
+NO_TRAIT_CUM_WEIGHTS = tuple(accumulate((0.02, 0.03, 0.15, 0.25, 0.55)))
 
 
 # ==================== UTILITIES ====================
@@ -53,14 +63,8 @@ def sample_human_like_answer(has_trait: bool) -> int:
     When the character *doesn't* have the trait, No/Probably No are more likely.
     """
     # Probabilities are deliberately asymmetric to bias toward the "true" side.
-    if has_trait:
-        codes   = [2, 1, 0, -1, -2]          # Yes, ProbYes, Maybe, ProbNo, No
-        weights = [0.55, 0.25, 0.15, 0.03, 0.02]
-    else:
-        codes   = [2, 1, 0, -1, -2]
-        weights = [0.02, 0.03, 0.15, 0.25, 0.55]
-
-    return random.choices(codes, weights, k=1)[0]
+    cum_weights = HAS_TRAIT_CUM_WEIGHTS if has_trait else NO_TRAIT_CUM_WEIGHTS
+    return _rng.choices(ANSWER_CODES, cum_weights=cum_weights, k=1)[0]
 
 
 """
@@ -110,7 +114,8 @@ def simulate_game_ideal(ai: AkinatorAI, target_char: str) -> dict:
         ai.update_probabilities(q_idx, user_answer=user_answer_bool)
 
         num_questions += 1
-        prob_trace.append(max(ai.probabilities))
+        # argmax-based summary, reused by should_make_guess/get_best_guess below
+        prob_trace.append(ai.snapshot()['top_prob'])
 
         if ai.should_make_guess(threshold=CONFIDENCE_THRESHOLD):
             guess, final_prob = ai.get_best_guess()
@@ -185,7 +190,8 @@ def simulate_game_human_like(ai: AkinatorAI, target_char: str) -> dict:
             pass
 
         num_questions += 1
-        prob_trace.append(max(ai.probabilities))
+        # argmax-based summary, reused by should_make_guess/get_best_guess below
+        prob_trace.append(ai.snapshot()['top_prob'])
 
         if ai.should_make_guess(threshold=CONFIDENCE_THRESHOLD):
             guess, final_prob = ai.get_best_guess()
@@ -242,7 +248,7 @@ def run_experiments(mode: str, results_path_prefix: str):
     if NUM_GAMES is None or NUM_GAMES >= len(characters):
         targets = characters
     else:
-        targets = random.sample(characters, NUM_GAMES)  # sample to keep runs quick
+        targets = _rng.sample(characters, NUM_GAMES)  # sample to keep runs quick
 
     print(f"\n=== Running {mode.upper()} mode on {len(targets)} games ===")
 
@@ -282,7 +288,9 @@ def run_experiments(mode: str, results_path_prefix: str):
 
     print(f"[{mode}] Saved results to {csv_path}")
 
-    # Plots
+    # Plots (matplotlib is only imported once there is something to draw)
+    import matplotlib.pyplot as plt
+
     questions_list = [r["questions"] for r in results]
     correct_count = num_correct
     incorrect_count = n - num_correct
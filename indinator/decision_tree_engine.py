@@ -11,10 +11,7 @@ Methods to implement:
     - reset()
 """
 
-import json
-import math
 import numpy as np
-from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Set
 from sklearn.tree import DecisionTreeClassifier
 
@@ -33,6 +30,49 @@ class DecisionTreeAI:
     based on information gain (entropy-based splitting).
     """
     
+    # Map franchises to their primary source medium
+    FRANCHISE_MEDIA = {
+        'franchise_star_wars': 'source_movie',
+        'franchise_harry_potter': 'source_movie',
+        'franchise_lotr': 'source_movie',
+        'franchise_marvel': 'source_comic_manga',
+        'franchise_dc': 'source_comic_manga',
+        'franchise_naruto': 'source_anime',
+        'franchise_one_piece': 'source_anime',
+        'franchise_dragon_ball': 'source_anime',
+        'franchise_pokemon': 'source_anime',
+        'franchise_mario': 'source_video_game',
+        'franchise_zelda': 'source_video_game',
+        'franchise_witcher': 'source_video_game',
+        'franchise_halo': 'source_video_game',
+        'franchise_got': 'source_tv_streaming',
+        'franchise_breaking_bad': 'source_tv_streaming',
+        'franchise_stranger_things': 'source_tv_streaming',
+        'franchise_pirates': 'source_movie',
+        'franchise_matrix': 'source_movie',
+        'franchise_incredibles': 'source_movie',
+        'franchise_toy_story': 'source_movie',
+        'franchise_shrek': 'source_movie',
+        'franchise_frozen': 'source_movie',
+        'franchise_demon_slayer': 'source_anime',
+        'franchise_avatar_tla': 'source_cartoon',
+        'franchise_walking_dead': 'source_tv_streaming',
+        'franchise_sonic': 'source_video_game',
+    }
+    
+    # Tie-break order for early-game questions of equal priority (broad to specific)
+    BROAD_ORDER = {
+        'source': 0,
+        'world': 1,
+        'setting': 2,
+        'identity': 3,
+        'role': 4,
+        'affiliation': 5,
+        'abilities': 6,
+        'appearance': 7,
+        'personality': 8
+    }
+    
     def __init__(self, traits_file: str, questions_file: str, characters_file: str = None,
                  max_depth: int = 20, min_samples_split: int = 2):
         """
@@ -49,12 +89,15 @@ class DecisionTreeAI:
         print("[INIT] Initializing feature extractor...")
         self.feature_extractor = FeatureExtractor(traits_file, questions_file)
         
-        # Load questions for compatibility with existing code
-        self.questions = self._load_json(questions_file)
+        # Share the extractor's parsed question list instead of decoding
+        # questions.json a second time (both treat it as read-only)
+        self.questions = self.feature_extractor.questions
         
         # Get character list
         self.characters = sorted(self.feature_extractor.traits.keys())
         self.num_characters = len(self.characters)
+        self._char_to_idx = {char: idx for idx, char in enumerate(self.characters)}
+        self._build_name_index()
         
         # Build training data
         print("[INIT] Building training data...")
@@ -65,6 +108,9 @@ class DecisionTreeAI:
         self.y_train = y
         self.character_list = character_list
         
+        # Memoized per-feature boolean columns (traits are static, so computed once per feature)
+        self._feature_columns: Dict[int, np.ndarray] = {}
+        
         # Train Decision Tree
         print("[INIT] Training Decision Tree...")
         self.tree = DecisionTreeClassifier(
@@ -81,6 +127,25 @@ class DecisionTreeAI:
         print(f"   Leaves: {self.tree.get_n_leaves()}")
         print(f"   Features used: {np.sum(self.tree.feature_importances_ > 0)}")
         
+        # Allocate game state once; reset() refills these buffers in place
+        n_features = len(self.feature_extractor.feature_names)
+        self.current_feature_vector = np.empty(n_features, dtype=np.int8)
+        self.known_mask = np.empty(n_features, dtype=bool)
+        self.asked_questions: Set[int] = set()
+        self.question_history: List[Dict] = []
+        self.answer_confidence: Dict[str, float] = {}
+        
+        # Uniform prior over characters, copied into self.probabilities on reset
+        self._prior = np.full(self.num_characters, 1.0 / self.num_characters)
+        
+        # Character probabilities, aligned with self.characters (see _char_to_idx).
+        # Updated in place by reset() and the penalize/boost helpers; any other
+        # in-place write must call _probabilities_changed() so the cached
+        # entropy and snapshot below are invalidated.
+        self.probabilities = self._prior.copy()
+        self._entropy_cache: Optional[float] = None
+        self._snapshot: Optional[Dict] = None
+        
         # Initialize game state (will be reset at start of each game)
         self.reset()
         
@@ -89,44 +154,41 @@ class DecisionTreeAI:
             trait for trait in self.feature_extractor.trait_to_index
             if trait.startswith('source_')
         ]
+        self._source_feature_indices = [
+            (trait, self.feature_extractor.trait_to_index[trait]) for trait in self.source_traits
+        ]
+        
+        # Static (priority, broadness) ordering of questions for the early game
+        self._priority_order = self._build_priority_order()
     
     def reset(self):
         """
         Reset the game state for a new game.
         
-        Initializes:
+        Reuses the buffers allocated in __init__ rather than building new ones:
         - Current feature vector (all unknown: -1)
         - Known mask (all False)
         - Asked questions set
         - Question history
-        - Character probabilities (for compatibility)
+        - Character probabilities (uniform prior)
         """
-        # Create initial feature vector (all unknown)
-        self.current_feature_vector = np.full(
-            len(self.feature_extractor.feature_names), 
-            -1, 
-            dtype=np.int8
-        )
-        
-        # Create mask tracking which features are known
-        self.known_mask = np.zeros(
-            len(self.feature_extractor.feature_names), 
-            dtype=bool
-        )
+        # Mark every feature unknown
+        self.current_feature_vector.fill(-1)
+        self.known_mask.fill(False)
         
         # Track asked questions
-        self.asked_questions: Set[int] = set()
-        self.question_history: List[Dict] = []
+        self.asked_questions.clear()
+        self.question_history.clear()
         
         # Track answer confidence for each trait (for probabilistic answers)
         # Maps trait_name -> confidence (1.0 for yes/no, 0.75 for probably/probably_not)
-        self.answer_confidence: Dict[str, float] = {}
+        self.answer_confidence.clear()
         
-        # Character probabilities (for compatibility with existing code)
-        # Initialize with uniform distribution
-        self.probabilities = [1.0 / self.num_characters] * self.num_characters
+        # Character probabilities, aligned with self.characters (see _char_to_idx)
+        self.probabilities[:] = self._prior
+        self._probabilities_changed()
     
-    def select_best_question(self) -> Optional[int]:
+    def select_best_question(self, focus_top_n: int = 10) -> Optional[int]:
         """
         Select the best next question using the Decision Tree.
         
@@ -136,6 +198,10 @@ class DecisionTreeAI:
         3. When we hit a node that splits on an unknown feature, ask about that feature
         4. If we can't traverse (all needed features unknown), use feature importance
         
+        Args:
+            focus_top_n: Number of most likely characters the feature-importance
+                         fallback tries to split (default: 10)
+        
         Returns:
             Question index, or None if no more questions available
         """
@@ -201,15 +267,18 @@ class DecisionTreeAI:
                 break
         
         # Fallback: Use feature importance to pick best unknown feature
-        return self._select_by_feature_importance()
+        return self._select_by_feature_importance(focus_top_n)
     
-    def _select_by_feature_importance(self) -> Optional[int]:
+    def _select_by_feature_importance(self, focus_top_n: int = 10) -> Optional[int]:
         """
         Select question based on information gain and feature importance.
         
         Uses information gain to pick questions that best split remaining candidates.
         Combines this with feature importance for better question selection.
         
+        Args:
+            focus_top_n: Number of most likely characters to measure information gain over
+        
         Returns:
             Question index, or None if no questions available
         """
@@ -225,59 +294,35 @@ class DecisionTreeAI:
         
         # Get top candidates (characters with highest probability)
         # Focus on traits that help distinguish between likely candidates
-        top_candidates = self.get_top_characters(10)  # Top 10 candidates
-        top_chars = [char for char, _ in top_candidates]
-        
-        # Calculate information gain for each unknown feature
-        scored_features = []
-        
-        for feature_idx in unknown_indices:
-            trait_name = self.feature_extractor.index_to_trait[feature_idx]
-            importance = importances[feature_idx]
-            
-            # Calculate information gain: how well does this trait split top candidates?
-            # Count how many top candidates have this trait vs don't
-            has_trait = 0
-            no_trait = 0
-            
-            for char in top_chars:
-                char_traits = self.feature_extractor.traits.get(char, {})
-                if char_traits.get(trait_name, 0) == 1:
-                    has_trait += 1
-                else:
-                    no_trait += 1
-            
-            # Information gain: prefer traits that split candidates roughly 50/50
-            # Perfect split (50/50) = maximum information gain
-            total = has_trait + no_trait
-            if total == 0:
-                info_gain = 0.0
-            else:
-                # Calculate entropy reduction
-                p_yes = has_trait / total
-                p_no = no_trait / total
-                
-                # Entropy: -p*log2(p) - (1-p)*log2(1-p)
-                if p_yes > 0 and p_no > 0:
-                    entropy = -(p_yes * math.log2(p_yes) + p_no * math.log2(p_no))
-                else:
-                    entropy = 0.0  # Pure split (all yes or all no) = 0 entropy
-                
-                # Information gain: higher entropy = better split
-                info_gain = entropy
-            
-            # Combine information gain with feature importance
-            # Weight: 70% information gain, 30% feature importance
-            combined_score = 0.7 * info_gain + 0.3 * importance
-            
-            scored_features.append((feature_idx, trait_name, combined_score, info_gain, importance))
-        
-        # Sort by combined score (highest first)
-        scored_features.sort(key=lambda x: x[2], reverse=True)
+        # (partial partition over the probabilities, no full sort or name round-trip)
+        top_rows = self._top_indices(self.probabilities, focus_top_n)
+        
+        # Calculate information gain for every unknown feature in one batch:
+        # count how many top candidates have each trait vs don't
+        has_trait = (self.X_train[np.ix_(top_rows, unknown_indices)] == 1).sum(axis=0)
+        total = len(top_rows)
+        
+        # Information gain: prefer traits that split candidates roughly 50/50
+        # Perfect split (50/50) = maximum information gain
+        # Entropy: -p*log2(p) - (1-p)*log2(1-p); pure splits (all yes or all no) = 0 entropy
+        info_gain = np.zeros(len(unknown_indices))
+        if total > 0:
+            p_yes = has_trait / total
+            p_no = (total - has_trait) / total
+            split = (p_yes > 0) & (p_no > 0)
+            info_gain[split] = -(p_yes[split] * np.log2(p_yes[split]) + p_no[split] * np.log2(p_no[split]))
+        
+        # Combine information gain with feature importance
+        # Weight: 70% information gain, 30% feature importance
+        combined_score = 0.7 * info_gain + 0.3 * importances[unknown_indices]
+        
+        # Sort by combined score (highest first); stable so ties keep feature order
+        ranked = unknown_indices[np.argsort(-combined_score, kind='stable')]
         
         # Try each feature in order until we find one with an unasked question
-        for feature_idx, trait_name, combined_score, info_gain, importance in scored_features:
+        for feature_idx in ranked:
             # Find a question for this trait
+            trait_name = self.feature_extractor.index_to_trait[feature_idx]
             question_indices = self.feature_extractor.trait_to_questions.get(trait_name, [])
             
             # Pick first unasked, non-redundant question
@@ -296,40 +341,39 @@ class DecisionTreeAI:
         Pick next question by lowest priority value, skipping known traits and redundancy.
         Ensures we start with broad categories (source/world/setting/identity/role) before specifics.
         """
-        # Build list of candidate questions that are unasked, not redundant, and trait unknown
-        candidates = []
-        for q_idx, q in enumerate(self.questions):
+        # Questions are pre-sorted by (priority, broadness), so the first one that is
+        # unasked, has an unknown trait and isn't redundant is the best candidate
+        for q_idx, feat_idx in self._priority_order:
             if q_idx in self.asked_questions:
                 continue
+            if feat_idx >= 0 and self.known_mask[feat_idx]:
+                continue
             if self._is_redundant_question(q_idx):
                 continue
+            return q_idx
+        
+        return None
+    
+    def _build_priority_order(self) -> List[Tuple[int, int]]:
+        """
+        Sort questions once by priority, then by broadness of their group.
+        
+        Returns:
+            List of (question index, feature index) pairs in asking order;
+            feature index is -1 for traits missing from the feature matrix
+        """
+        order = []
+        for q_idx, q in enumerate(self.questions):
             trait = q.get('trait', '')
             if not trait:
                 continue
             feat_idx = self.feature_extractor.trait_to_index.get(trait, -1)
-            if feat_idx >= 0 and self.known_mask[feat_idx]:
-                continue
-            prio = q.get('priority', 99)
-            group = q.get('group', '')
-            candidates.append((prio, group, q_idx))
-        
-        if not candidates:
-            return None
+            sort_key = (q.get('priority', 99), self.BROAD_ORDER.get(q.get('group', ''), 9))
+            order.append((sort_key, q_idx, feat_idx))
         
-        # Sort by priority, then by a broadness order for tie-breaking
-        broad_order = {
-            'source': 0,
-            'world': 1,
-            'setting': 2,
-            'identity': 3,
-            'role': 4,
-            'affiliation': 5,
-            'abilities': 6,
-            'appearance': 7,
-            'personality': 8
-        }
-        candidates.sort(key=lambda x: (x[0], broad_order.get(x[1], 9)))
-        return candidates[0][2]
+        # Stable sort keeps question order for ties
+        order.sort(key=lambda entry: entry[0])
+        return [(q_idx, feat_idx) for _, q_idx, feat_idx in order]
     
     def _select_franchise_question(self) -> Optional[int]:
         """
@@ -436,44 +480,14 @@ class DecisionTreeAI:
             return False
         
         # Skip redundant source questions if any source is already confirmed yes
-        if trait.startswith('source_') and self.source_traits:
-            for src_trait in self.source_traits:
-                idx = self.feature_extractor.trait_to_index.get(src_trait, -1)
-                if idx >= 0 and self.known_mask[idx] and self.current_feature_vector[idx] == 1:
+        if trait.startswith('source_'):
+            for _, idx in self._source_feature_indices:
+                if self.known_mask[idx] and self.current_feature_vector[idx] == 1:
                     return True
         
         # Skip franchise questions that conflict with a confirmed source medium
         if trait.startswith('franchise_'):
-            # Map franchises to their primary source medium
-            franchise_media = {
-                'franchise_star_wars': 'source_movie',
-                'franchise_harry_potter': 'source_movie',
-                'franchise_lotr': 'source_movie',
-                'franchise_marvel': 'source_comic_manga',
-                'franchise_dc': 'source_comic_manga',
-                'franchise_naruto': 'source_anime',
-                'franchise_one_piece': 'source_anime',
-                'franchise_dragon_ball': 'source_anime',
-                'franchise_pokemon': 'source_anime',
-                'franchise_mario': 'source_video_game',
-                'franchise_zelda': 'source_video_game',
-                'franchise_witcher': 'source_video_game',
-                'franchise_halo': 'source_video_game',
-                'franchise_got': 'source_tv_streaming',
-                'franchise_breaking_bad': 'source_tv_streaming',
-                'franchise_stranger_things': 'source_tv_streaming',
-                'franchise_pirates': 'source_movie',
-                'franchise_matrix': 'source_movie',
-                'franchise_incredibles': 'source_movie',
-                'franchise_toy_story': 'source_movie',
-                'franchise_shrek': 'source_movie',
-                'franchise_frozen': 'source_movie',
-                'franchise_demon_slayer': 'source_anime',
-                'franchise_avatar_tla': 'source_cartoon',
-                'franchise_walking_dead': 'source_tv_streaming',
-                'franchise_sonic': 'source_video_game',
-            }
-            needed_source = franchise_media.get(trait)
+            needed_source = self.FRANCHISE_MEDIA.get(trait)
             if needed_source:
                 idx = self.feature_extractor.trait_to_index.get(needed_source, -1)
                 if idx >= 0 and self.known_mask[idx]:
@@ -481,9 +495,8 @@ class DecisionTreeAI:
                     if self.current_feature_vector[idx] != 1:
                         return True
                 # Also skip other franchises that don't align once a source is confirmed yes
-                for src_trait in self.source_traits:
-                    sidx = self.feature_extractor.trait_to_index.get(src_trait, -1)
-                    if sidx >= 0 and self.known_mask[sidx] and self.current_feature_vector[sidx] == 1:
+                for src_trait, sidx in self._source_feature_indices:
+                    if self.known_mask[sidx] and self.current_feature_vector[sidx] == 1:
                         if src_trait != needed_source:
                             return True
         
@@ -591,70 +604,57 @@ class DecisionTreeAI:
         For certain answers (yes/no), mismatches are penalized heavily.
         For probabilistic answers (probably/probably_not), mismatches are penalized less.
         """
-        # Get known traits from current feature vector
-        known_traits = {}
-        for i, is_known in enumerate(self.known_mask):
-            if is_known:
-                trait_name = self.feature_extractor.index_to_trait[i]
-                trait_value = int(self.current_feature_vector[i])
-                known_traits[trait_name] = trait_value
-        
-        if not known_traits:
+        # Get known features from current feature vector
+        known_idx = np.flatnonzero(self.known_mask)
+        
+        if len(known_idx) == 0:
             # No traits known yet - uniform distribution
-            self.probabilities = [1.0 / self.num_characters] * self.num_characters
+            self.probabilities[:] = self._prior
+            self._probabilities_changed()
             return
         
-        num_known_traits = len(known_traits)
+        num_known_traits = len(known_idx)
+        known_trait_names = [self.feature_extractor.index_to_trait[i] for i in known_idx]
+        known_values = self.current_feature_vector[known_idx]
+        
+        # Gather the known columns from the dense trait matrix in one shot
+        # instead of a dict lookup per (character, trait): rows follow self.characters
+        matches = self.X_train[:, known_idx] == known_values
+        match_counts = matches.sum(axis=1)
         
         # Hard filters: if a franchise or source trait is confirmed YES, eliminate characters without it
-        hard_yes_traits = {
-            trait_name for trait_name, val in known_traits.items()
+        hard_yes_cols = [
+            col for col, (trait_name, val) in enumerate(zip(known_trait_names, known_values))
             if val == 1 and (trait_name.startswith('franchise_') or trait_name.startswith('source_'))
-        }
+        ]
+        if hard_yes_cols:
+            missing_hard = ~matches[:, hard_yes_cols].all(axis=1)
+        else:
+            missing_hard = np.zeros(self.num_characters, dtype=bool)
         
-        # Calculate weighted scores for each character
-        # Use multiplicative-style scoring for better discrimination
-        character_scores = []
-        
-        for char in self.characters:
-            char_traits = self.feature_extractor.traits.get(char, {})
-            match_count = 0
-            mismatch_count = 0
-            total_weight = 0.0
+        # Answer confidence weights only depend on the known traits, not the character
+        total_weight = 0.0
+        for trait_name in known_trait_names:
+            confidence = self.answer_confidence.get(trait_name, 1.0)
             
-            # Apply hard filter: if char lacks any confirmed franchise/source YES trait, drop to near-zero
-            if hard_yes_traits:
-                missing_hard = False
-                for ht in hard_yes_traits:
-                    if char_traits.get(ht, 0) != 1:
-                        missing_hard = True
-                        break
-                if missing_hard:
-                    character_scores.append(1e-9)
-                    continue
+            # Extra weight for franchise/source traits
+            if trait_name.startswith('franchise_') or trait_name.startswith('source_'):
+                confidence = max(confidence, 1.2)
             
-            # Count matches and mismatches
-            for trait_name, expected_value in known_traits.items():
-                char_value = char_traits.get(trait_name, 0)
-                confidence = self.answer_confidence.get(trait_name, 1.0)
-                
-                # Extra weight for franchise/source traits
-                if trait_name.startswith('franchise_') or trait_name.startswith('source_'):
-                    confidence = max(confidence, 1.2)
-                
-                weight = confidence
-                total_weight += weight
-                
-                if char_value == expected_value:
-                    match_count += 1
-                else:
-                    mismatch_count += 1
+            total_weight += confidence
+        
+        # Calculate weighted scores for each character
+        # Use multiplicative-style scoring for better discrimination.
+        # A character's score only depends on how many known traits it matches, so
+        # score each possible match count once and gather per character.
+        score_by_match_count = np.empty(num_known_traits + 1)
+        
+        for match_count in range(num_known_traits + 1):
+            mismatch_count = num_known_traits - match_count
             
             # Calculate score: more matches = higher score, more mismatches = lower score
             # Use a ratio-based approach that becomes more aggressive with more traits
-            if num_known_traits == 0:
-                score = 1.0
-            elif mismatch_count == 0:
+            if mismatch_count == 0:
                 # Perfect match - high score with bonus
                 # Bonus increases exponentially with number of matching traits
                 # More traits = stronger signal that this is the right character
@@ -691,16 +691,22 @@ class DecisionTreeAI:
                 score *= (0.5 + 0.5 * avg_confidence)  # Scale by confidence
             
             # Apply minimum score but make it very small to allow better discrimination
-            character_scores.append(max(0.0001, score))  # Very small minimum to avoid zero
+            score_by_match_count[match_count] = max(0.0001, score)  # Very small minimum to avoid zero
+        
+        character_scores = score_by_match_count[match_counts]
+        
+        # Apply hard filter: if char lacks any confirmed franchise/source YES trait, drop to near-zero
+        character_scores[missing_hard] = 1e-9
         
         # Normalize scores to probabilities
-        total_score = sum(character_scores)
+        total_score = character_scores.sum()
         
         if total_score > 0:
-            self.probabilities = [score / total_score for score in character_scores]
+            self.probabilities = character_scores / total_score
         else:
             # Fallback: uniform distribution
-            self.probabilities = [1.0 / self.num_characters] * self.num_characters
+            self.probabilities = np.full(self.num_characters, 1.0 / self.num_characters)
+        self._probabilities_changed()
     
     def get_best_guess(self) -> Tuple[str, float]:
         """
@@ -710,11 +716,10 @@ class DecisionTreeAI:
             Tuple of (character_name, confidence) where confidence is 0-1
         """
         # Find character with highest probability
-        max_prob = max(self.probabilities)
-        max_idx = self.probabilities.index(max_prob)
-        best_character = self.characters[max_idx]
+        snapshot = self.snapshot()
+        best_character = self.characters[snapshot['top_idx']]
         
-        return best_character, max_prob
+        return best_character, snapshot['top_prob']
     
     def get_top_characters(self, n: int = 5) -> List[Tuple[str, float]]:
         """
@@ -726,14 +731,9 @@ class DecisionTreeAI:
         Returns:
             List of (character_name, probability) tuples, sorted by probability (descending)
         """
-        # Create list of (character, probability) pairs
-        char_probs = list(zip(self.characters, self.probabilities))
-        
-        # Sort by probability (descending)
-        char_probs.sort(key=lambda x: x[1], reverse=True)
-        
-        # Return top N
-        return char_probs[:n]
+        # Partial partition instead of sorting every character (ties keep character order)
+        top = self._top_indices(self.probabilities, n)
+        return [(self.characters[i], float(self.probabilities[i])) for i in top]
     
     def should_make_guess(self, threshold: float = 0.7, max_candidates: int = 5) -> bool:
         """
@@ -750,11 +750,12 @@ class DecisionTreeAI:
         Returns:
             True if we should make a guess, False otherwise
         """
-        if not self.probabilities:
+        if len(self.probabilities) == 0:
             return False
         
         # Get confidence of top character
-        max_prob = max(self.probabilities)
+        snapshot = self.snapshot()
+        max_prob = snapshot['top_prob']
         
         questions_asked = len(self.asked_questions)
         
@@ -774,7 +775,7 @@ class DecisionTreeAI:
         
         # Check number of remaining candidates
         # Use a higher threshold (0.5%) to only count meaningful candidates
-        remaining_candidates = len(self.get_remaining_candidates(min_prob=0.005))
+        remaining_candidates = snapshot['remaining_count']
 
         # Adaptive threshold: lower threshold when fewer candidates
         # More aggressive thresholds to encourage earlier guessing
@@ -825,7 +826,7 @@ class DecisionTreeAI:
         
         return {
             'questions_asked': len(self.asked_questions),
-            'entropy': self.entropy(self.probabilities),
+            'entropy': self.snapshot()['entropy'],
             'top_character': top_5[0] if top_5 else ('Unknown', 0.0),
             'top_5': top_5,
             'remaining_candidates': len(candidates),
@@ -847,7 +848,52 @@ class DecisionTreeAI:
         Returns:
             Entropy value in bits (typically 0-7 for 100 characters)
         """
-        return -sum(p * math.log2(p) for p in probabilities if p > 1e-10)
+        # Reuse the cached value when asked about our own (unchanged) distribution
+        is_current = probabilities is self.probabilities
+        if is_current and self._entropy_cache is not None:
+            return self._entropy_cache
+        
+        p = np.asarray(probabilities, dtype=float)
+        p = p[p > 1e-10]
+        value = float(-np.sum(p * np.log2(p)))
+        
+        if is_current:
+            self._entropy_cache = value
+        return value
+    
+    def _probabilities_changed(self):
+        """
+        Invalidate values derived from self.probabilities.
+        
+        Must be called whenever self.probabilities is reassigned or modified.
+        """
+        self._entropy_cache = None
+        self._snapshot = None
+    
+    def snapshot(self) -> Dict:
+        """
+        Get per-turn summary of the probability distribution, computed in one pass.
+        
+        Cached until the probabilities change, so should_make_guess, get_best_guess
+        and get_stats don't each rescan the distribution.
+        
+        Returns:
+            Dictionary with:
+            - 'top_idx': Index of the most probable character
+            - 'top_prob': Probability of that character
+            - 'entropy': Entropy of the distribution (bits)
+            - 'remaining_count': Number of meaningful candidates (probability >= 0.5%)
+        """
+        if self._snapshot is None:
+            probs = self.probabilities
+            top_idx = int(np.argmax(probs))
+            self._snapshot = {
+                'top_idx': top_idx,
+                'top_prob': float(probs[top_idx]),
+                'entropy': self.entropy(self.probabilities),
+                'remaining_count': int(np.count_nonzero(probs >= 0.005)),
+            }
+        return self._snapshot
     
     def get_remaining_candidates(self, min_prob: float = 0.001) -> List[str]:
         """
@@ -860,10 +906,7 @@ class DecisionTreeAI:
         Returns:
             List of character names that are still possible
         """
-        return [
-            char for char, prob in zip(self.characters, self.probabilities)
-            if prob >= min_prob
-        ]
+        return [self.characters[i] for i in np.flatnonzero(self.probabilities >= min_prob)]
     
     def find_character(self, name: str) -> Optional[str]:
         """
@@ -883,26 +926,46 @@ class DecisionTreeAI:
         name_lower = name.lower().strip()
         
         # Exact match first (most reliable)
-        for char in self.characters:
-            if char.lower() == name_lower:
-                return char
+        exact_idx = self._exact_name_index.get(name_lower)
+        if exact_idx is not None:
+            return self.characters[exact_idx]
         
         # Partial match (substring)
         # Example: "harry" matches "Harry Potter"
-        for char in self.characters:
-            if name_lower in char.lower() or char.lower() in name_lower:
+        for char, char_lower in zip(self.characters, self._names_lower):
+            if name_lower in char_lower or char_lower in name_lower:
                 return char
         
         # Word match (any word in name)
         # Example: "potter" matches "Harry Potter"
-        name_words = set(name_lower.split())
-        for char in self.characters:
-            char_words = set(char.lower().split())
-            if name_words & char_words:  # Any word overlap
-                return char
+        matched = set()
+        for word in name_lower.split():
+            matched.update(self._name_token_index.get(word, ()))
+        if matched:
+            # Lowest index = first match in character order
+            return self.characters[min(matched)]
         
         return None
     
+    def _build_name_index(self):
+        """
+        Precompute lowercase names and a word -> character indices map for find_character.
+        
+        Character names never change after init, so lowercasing and splitting
+        them on every lookup is wasted work.
+        """
+        self._names_lower = [char.lower() for char in self.characters]
+        
+        # Lowercase name -> first character index with that name
+        self._exact_name_index: Dict[str, int] = {}
+        # Lowercase word -> indices of characters whose name contains that word
+        self._name_token_index: Dict[str, Set[int]] = {}
+        
+        for idx, char_lower in enumerate(self._names_lower):
+            self._exact_name_index.setdefault(char_lower, idx)
+            for word in char_lower.split():
+                self._name_token_index.setdefault(word, set()).add(idx)
+    
     def penalize_wrong_guess(self, character: str, penalty_factor: float = 0.01):
         """
         Drastically reduce probability of a character after wrong guess.
@@ -912,23 +975,42 @@ class DecisionTreeAI:
             penalty_factor: Multiply probability by this factor (0.01 = 99% reduction)
                            Lower values = stronger penalty
         """
-        if character in self.characters:
-            idx = self.characters.index(character)
+        idx = self._char_to_idx.get(character)
+        if idx is not None:
             self.probabilities[idx] *= penalty_factor
             
             # Normalize probabilities
-            total = sum(self.probabilities)
+            total = self.probabilities.sum()
             if total > 0:
-                self.probabilities = [p / total for p in self.probabilities]
+                self.probabilities /= total
             else:
                 # Fallback: uniform distribution
-                self.probabilities = [1.0 / self.num_characters] * self.num_characters
+                self.probabilities.fill(1.0 / self.num_characters)
+            self._probabilities_changed()
             
             # Only print penalty message in verbose mode (not during benchmarks)
             # This reduces noise during large-scale testing
             # Uncomment the line below if you want to see penalty messages:
             # print(f"   🔻 Reduced probability of {character} by {(1-penalty_factor)*100:.0f}%")
     
+    def _top_indices(self, probs: np.ndarray, k: int) -> np.ndarray:
+        """
+        Get indices of the K largest probabilities, highest first.
+        
+        Uses a partial partition (O(n)) instead of a full sort. Ties keep
+        character order, matching a stable descending sort.
+        """
+        n = len(probs)
+        if k <= 0:
+            return np.empty(0, dtype=np.intp)
+        if k >= n:
+            return np.argsort(-probs, kind='stable')
+        
+        # Everything >= the K-th largest value (ties included), then order just those
+        kth_value = np.partition(probs, n - k)[n - k]
+        candidates = np.flatnonzero(probs >= kth_value)
+        return candidates[np.argsort(-probs[candidates], kind='stable')][:k]
+    
     def boost_character(self, character: str, boost_factor: float = 100.0) -> Optional[str]:
         """
         Increase probability of a character (e.g., when user reveals correct answer).
@@ -946,16 +1028,17 @@ class DecisionTreeAI:
         found_char = self.find_character(character)
         
         if found_char:
-            idx = self.characters.index(found_char)
+            idx = self._char_to_idx[found_char]
             self.probabilities[idx] *= boost_factor
             
             # Normalize probabilities
-            total = sum(self.probabilities)
+            total = self.probabilities.sum()
             if total > 0:
-                self.probabilities = [p / total for p in self.probabilities]
+                self.probabilities /= total
             else:
                 # Fallback: uniform distribution
-                self.probabilities = [1.0 / self.num_characters] * self.num_characters
+                self.probabilities.fill(1.0 / self.num_characters)
+            self._probabilities_changed()
             
             print(f"   🔺 Boosted probability of {found_char}")
             return found_char
@@ -984,26 +1067,24 @@ class DecisionTreeAI:
         
         # Get top 5 candidates to find discriminating traits
         top_candidates = self.get_top_characters(5)
-        top_chars = [char for char, _ in top_candidates]
+        other_rows = np.array([self._char_to_idx[c] for c, _ in top_candidates if c != character],
+                              dtype=np.intp)
         
         # Find traits that distinguish the target from other top candidates
         discriminating_traits = []
         
         for trait_name, value in char_traits.items():
             if value == 1:  # Target character has this trait
+                feature_idx = self.feature_extractor.trait_to_index.get(trait_name, -1)
+                if feature_idx == -1:
+                    continue
+                column = self._feature_column(feature_idx)
+                
                 # Check how many of the OTHER top candidates also have it
-                other_top_with_trait = 0
-                for c in top_chars:
-                    if c != character:
-                        other_traits = self.feature_extractor.traits.get(c, {})
-                        if other_traits.get(trait_name, 0) == 1:
-                            other_top_with_trait += 1
+                other_top_with_trait = int(column[other_rows].sum())
                 
                 # Count total characters with this trait (for rarity)
-                total_with_trait = sum(
-                    1 for c in self.characters
-                    if self.feature_extractor.traits.get(c, {}).get(trait_name, 0) == 1
-                )
+                total_with_trait = int(column.sum())
                 
                 # Prefer traits that:
                 # 1. The target has but other top candidates DON'T (high discrimination)
@@ -1013,7 +1094,7 @@ class DecisionTreeAI:
                     for q_idx in question_indices:
                         if q_idx not in self.asked_questions:
                             # Score: heavily weight discrimination from top candidates
-                            discrimination_score = (len(top_chars) - other_top_with_trait) * 1000
+                            discrimination_score = (len(top_candidates) - other_top_with_trait) * 1000
                             rarity_bonus = max(0, (10 - total_with_trait)) * 10
                             total_score = discrimination_score + rarity_bonus
                             
@@ -1028,11 +1109,21 @@ class DecisionTreeAI:
         
         return None
     
-    def _load_json(self, filepath: str) -> dict:
-        """Load JSON file."""
-        path = Path(filepath)
-        if not path.exists():
-            # Try relative to project root
-            path = Path(__file__).parent.parent / filepath
-        with open(path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+    def _feature_column(self, feature_idx: int) -> np.ndarray:
+        """
+        Get a boolean column marking which characters have the given feature.
+        
+        Rows follow self.characters. Columns are memoized since the trait
+        data never changes after init.
+        
+        Args:
+            feature_idx: Feature index (column in the training matrix)
+            
+        Returns:
+            Boolean array of shape (num_characters,)
+        """
+        column = self._feature_columns.get(feature_idx)
+        if column is None:
+            column = np.ascontiguousarray(self.X_train[:, feature_idx] == 1)
+            self._feature_columns[feature_idx] = column
+        return column
@@ -8,6 +8,21 @@ import numpy as np
 from pathlib import Path
 from typing import Dict, List, Set, Tuple
 
+# Optional fast JSON parser (falls back to stdlib json)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Map answer type -> binary trait value
+# "yes" and "probably" → 1 (has trait), "no" and "probably_not" → 0 (doesn't have trait)
+_ANSWER_TO_BIT = {
+    "yes": 1,
+    "probably": 1,
+    "no": 0,
+    "probably_not": 0,
+}
+
 
 class FeatureExtractor:
     """
@@ -64,6 +79,12 @@ class FeatureExtractor:
                     self.trait_to_questions[trait] = []
                 self.trait_to_questions[trait].append(q_idx)
         
+        # Dense character x trait matrix, built once so per-character lookups
+        # are a row slice instead of a walk over the traits dict
+        self.character_list = sorted(self.traits.keys())
+        self._char_to_row = {char: idx for idx, char in enumerate(self.character_list)}
+        self.X = self._build_dense_matrix()
+        
         print(f"[OK] Feature extractor initialized:")
         print(f"   Characters: {len(self.traits)}")
         print(f"   Features (traits): {len(self.feature_names)}")
@@ -83,26 +104,12 @@ class FeatureExtractor:
             y: Labels array (n_characters) - character names
             character_list: List of character names in same order as rows
         """
-        # Get list of characters (sorted for consistency)
-        character_list = sorted(self.traits.keys())
+        character_list = list(self.character_list)
         n_characters = len(character_list)
         n_features = len(self.feature_names)
         
-        # Initialize feature matrix with zeros
-        # Shape: (n_characters, n_features)
-        X = np.zeros((n_characters, n_features), dtype=np.int8)
-        
-        # Fill in the matrix
-        for char_idx, character in enumerate(character_list):
-            character_traits = self.traits[character]
-            
-            # For each trait this character has, set corresponding feature to 1
-            for trait_name, value in character_traits.items():
-                # Only process traits that are in our feature space
-                if trait_name in self.trait_to_index:
-                    feature_idx = self.trait_to_index[trait_name]
-                    # Set to 1 if character has trait (value should be 1 in JSON)
-                    X[char_idx, feature_idx] = int(value) if value else 0
+        # Matrix is precomputed in __init__; hand out a copy so callers can't mutate ours
+        X = self.X.copy()
         
         # Create labels array (character names)
         y = np.array(character_list)
@@ -127,20 +134,12 @@ class FeatureExtractor:
             Feature vector (1D numpy array) with same length as feature_names
             Values are 0 or 1 (binary)
         """
-        # Initialize vector with all zeros
-        feature_vector = np.zeros(len(self.feature_names), dtype=np.int8)
+        row = self._char_to_row.get(character)
+        if row is None:
+            # Unknown character: all-zero vector
+            return np.zeros(len(self.feature_names), dtype=np.int8)
         
-        # If character exists, fill in their traits
-        if character in self.traits:
-            character_traits = self.traits[character]
-            
-            # Set features to 1 for traits this character has
-            for trait_name, value in character_traits.items():
-                if trait_name in self.trait_to_index:
-                    feature_idx = self.trait_to_index[trait_name]
-                    feature_vector[feature_idx] = int(value) if value else 0
-        
-        return feature_vector
+        return self.X[row].copy()
     
     def get_trait_index(self, trait_name: str) -> int:
         """
@@ -190,18 +189,19 @@ class FeatureExtractor:
             feature_vector: Feature vector with -1 for unknown traits
             known_mask: Boolean mask indicating which features are known (True = known, False = unknown)
         """
-        # Initialize vector with -1 (unknown) for all features
-        feature_vector = np.full(len(self.feature_names), -1, dtype=np.int8)
+        n_features = len(self.feature_names)
+        known = [trait for trait in known_traits if trait in self.trait_to_index]
         
-        # Create mask to track which features are known
-        known_mask = np.zeros(len(self.feature_names), dtype=bool)
+        # Scatter known values in one shot instead of a per-trait Python loop
+        trait_idx = np.fromiter((self.trait_to_index[t] for t in known), dtype=np.int64, count=len(known))
+        values = np.fromiter((int(known_traits[t]) if known_traits[t] else 0 for t in known),
+                             dtype=np.int8, count=len(known))
         
-        # Fill in known traits
-        for trait_name, value in known_traits.items():
-            if trait_name in self.trait_to_index:
-                feature_idx = self.trait_to_index[trait_name]
-                feature_vector[feature_idx] = int(value) if value else 0
-                known_mask[feature_idx] = True
+        # -1 = unknown, mask tracks which features are known
+        feature_vector = np.full(n_features, -1, dtype=np.int8)
+        feature_vector[trait_idx] = values
+        known_mask = np.zeros(n_features, dtype=bool)
+        known_mask[trait_idx] = True
         
         return feature_vector, known_mask
     
@@ -223,34 +223,26 @@ class FeatureExtractor:
         Returns:
             Updated feature_vector and known_mask (same objects, modified in place)
         """
-        # Handle "don't know" - don't update anything
-        if answer == "dont_know":
+        # "dont_know" and unknown answer types don't update anything
+        bit = _ANSWER_TO_BIT.get(answer)
+        if bit is None:
             return feature_vector, known_mask
         
-        # Get the trait this question asks about
-        trait_name = self.get_question_trait(question_idx)
+        # Get the trait this question asks about (inlined get_question_trait)
+        trait_name = self.question_to_trait.get(question_idx, "")
         
         if not trait_name:
             # Question doesn't map to a trait, nothing to update
             return feature_vector, known_mask
         
-        # Get the feature index for this trait
-        feature_idx = self.get_trait_index(trait_name)
+        # Get the feature index for this trait (inlined get_trait_index)
+        feature_idx = self.trait_to_index.get(trait_name, -1)
         
         if feature_idx == -1:
             # Trait not in feature space, nothing to update
             return feature_vector, known_mask
         
-        # Map answer to binary value
-        # "yes" and "probably" → 1 (has trait)
-        # "no" and "probably_not" → 0 (doesn't have trait)
-        if answer in ["yes", "probably"]:
-            feature_vector[feature_idx] = 1
-        elif answer in ["no", "probably_not"]:
-            feature_vector[feature_idx] = 0
-        else:
-            # Unknown answer type - don't update
-            return feature_vector, known_mask
+        feature_vector[feature_idx] = bit
         
         # Update the known mask if provided
         # Note: "probably" and "probably_not" are still marked as known, but with lower confidence
@@ -260,11 +252,34 @@ class FeatureExtractor:
         
         return feature_vector, known_mask
     
+    def _build_dense_matrix(self) -> np.ndarray:
+        """
+        Build the binary character x trait matrix (rows follow self.character_list).
+        
+        Returns:
+            int8 matrix of shape (n_characters, n_features)
+        """
+        X = np.zeros((len(self.character_list), len(self.feature_names)), dtype=np.int8)
+        
+        for char_idx, character in enumerate(self.character_list):
+            for trait_name, value in self.traits[character].items():
+                # Only process traits that are in our feature space
+                feature_idx = self.trait_to_index.get(trait_name)
+                if feature_idx is not None:
+                    # Set to 1 if character has trait (value should be 1 in JSON)
+                    X[char_idx, feature_idx] = int(value) if value else 0
+        
+        return X
+    
     def _load_json(self, filepath: str) -> dict:
         """Load JSON file."""
         path = Path(filepath)
         if not path.exists():
             # Try relative to project root
             path = Path(__file__).parent.parent / filepath
+        if orjson is not None:
+            # C parser: much faster than stdlib json on the trait/question files
+            with open(path, 'rb') as f:
+                return orjson.loads(f.read())
         with open(path, 'r', encoding='utf-8') as f:
             return json.load(f)
@@ -3,6 +3,7 @@ Akinator Game - CLI interface for Decision Tree AI
 Handles user interaction and game loop.
 """
 
+import sys
 from typing import Optional, Literal
 from .decision_tree_engine import DecisionTreeAI
 
@@ -10,6 +11,28 @@ from .decision_tree_engine import DecisionTreeAI
 AnswerType = Literal["yes", "no", "probably", "probably_not", "dont_know"]
 
 
+class ConsoleIO:
+    """
+    Console input/output for the game (default).
+    
+    Output is left in the stdout buffer and flushed once right before
+    we block on input, instead of flushing after every prompt fragment.
+    """
+    
+    def write(self, text: str = "", end: str = "\n"):
+        """Write text to stdout without forcing a flush."""
+        sys.stdout.write(f"{text}{end}")
+    
+    def read_line(self) -> str:
+        """Flush pending output and read one line of user input."""
+        self.flush()
+        return input()
+    
+    def flush(self):
+        """Flush buffered output."""
+        sys.stdout.flush()
+
+
 class AkinatorGame:
     """
     Main game class that handles user interaction and game loop.
@@ -18,7 +41,7 @@ class AkinatorGame:
     """
     
     def __init__(self, ai: DecisionTreeAI, max_questions: int = 30, confidence_threshold: float = 0.85, 
-                 min_questions: int = 5, show_stats: bool = True):
+                 min_questions: int = 5, show_stats: bool = True, io=None):
         """
         Initialize the game with an AI engine.
         
@@ -28,12 +51,14 @@ class AkinatorGame:
             confidence_threshold: Confidence threshold for making a guess (default: 0.85 = 85%)
             min_questions: Minimum questions to ask before allowing a guess (default: 5)
             show_stats: Whether to show stats after each question (default: True)
+            io: Input/output adapter (default: ConsoleIO)
         """
         self.ai = ai
         self.max_questions = max_questions
         self.confidence_threshold = confidence_threshold
         self.min_questions = min_questions
         self.show_stats = show_stats
+        self.io = io if io is not None else ConsoleIO()
         
         # Game statistics (optional, for tracking)
         self.games_played = 0
@@ -50,10 +75,10 @@ class AkinatorGame:
         - Handling correct/incorrect guesses
         - Game restart
         """
-        print("=" * 60)
-        print("🎮 Welcome to Indinator!")
-        print("Think of a character, and I'll try to guess it!")
-        print("=" * 60)
+        self._emit("=" * 60)
+        self._emit("🎮 Welcome to Indinator!")
+        self._emit("Think of a character, and I'll try to guess it!")
+        self._emit("=" * 60)
         
         # Main game loop (can play multiple games)
         while True:
@@ -61,8 +86,8 @@ class AkinatorGame:
             self.ai.reset()
             self.games_played += 1
             
-            print(f"\n🎯 Game #{self.games_played}")
-            print("Think of a character...\n")
+            self._emit(f"\n🎯 Game #{self.games_played}")
+            self._emit("Think of a character...\n")
             
             # Question-asking loop
             questions_asked = 0
@@ -99,7 +124,7 @@ class AkinatorGame:
                     else:
                         # Can't select a question and shouldn't guess yet - this shouldn't happen
                         # but if it does, force a guess as last resort
-                        print("\n⚠️  Warning: No more questions available but criteria not met. Making final guess...")
+                        self._emit("\n⚠️  Warning: No more questions available but criteria not met. Making final guess...")
                         if self._make_guess():
                             game_won = True
                             self.games_won += 1
@@ -116,7 +141,7 @@ class AkinatorGame:
                     revealed_char = self._reveal_answer()
                     if revealed_char:
                         self.ai.boost_character(revealed_char)
-                        print(f"\n✓ Got it! The character was: {revealed_char}")
+                        self._emit(f"\n✓ Got it! The character was: {revealed_char}")
                         self.games_won += 1
                     break
                 
@@ -130,7 +155,7 @@ class AkinatorGame:
             
             # If we hit max questions without winning, ask user to reveal
             if not game_won and questions_asked >= self.max_questions:
-                print(f"\n🤔 I've asked {questions_asked} questions. Let me make a final guess...")
+                self._emit(f"\n🤔 I've asked {questions_asked} questions. Let me make a final guess...")
                 if self._make_guess():
                     game_won = True
                     self.games_won += 1
@@ -139,21 +164,26 @@ class AkinatorGame:
                     revealed_char = self._reveal_answer()
                     if revealed_char:
                         self.ai.boost_character(revealed_char)
-                        print(f"\n✓ Got it! The character was: {revealed_char}")
+                        self._emit(f"\n✓ Got it! The character was: {revealed_char}")
             
             # Ask if user wants to play again
             if not self._play_again():
                 break
         
         # Game over - show statistics
-        print("\n" + "=" * 60)
-        print("🎮 Thanks for playing Indinator!")
+        self._emit("\n" + "=" * 60)
+        self._emit("🎮 Thanks for playing Indinator!")
         if self.games_played > 0:
             win_rate = (self.games_won / self.games_played) * 100
-            print(f"📊 Games played: {self.games_played}")
-            print(f"🏆 Games won: {self.games_won}")
-            print(f"📈 Win rate: {win_rate:.1f}%")
-        print("=" * 60)
+            self._emit(f"📊 Games played: {self.games_played}")
+            self._emit(f"🏆 Games won: {self.games_won}")
+            self._emit(f"📈 Win rate: {win_rate:.1f}%")
+        self._emit("=" * 60)
+        self.io.flush()
+    
+    def _emit(self, text: str = "", end: str = "\n"):
+        """Send output through the IO adapter."""
+        self.io.write(text, end=end)
     
     def _ask_question(self, question_idx: int) -> Optional[AnswerType]:
         """
@@ -174,15 +204,15 @@ class AkinatorGame:
         question_text = question_data.get('question', '')
         
         # Display question
-        print(f"❓ {question_text}")
-        print("   (y/n/p/pn/dk/guess/quit): ", end="", flush=True)
-        print("\n   y=yes, n=no, p=probably, pn=probably not, dk=don't know", end="", flush=True)
-        print("\n   Enter choice: ", end="", flush=True)
+        self._emit(f"❓ {question_text}")
+        self._emit("   (y/n/p/pn/dk/guess/quit): ", end="")
+        self._emit("\n   y=yes, n=no, p=probably, pn=probably not, dk=don't know", end="")
+        self._emit("\n   Enter choice: ", end="")
         
         # Get user input
         while True:
             try:
-                user_input = input().strip().lower()
+                user_input = self.io.read_line().strip().lower()
                 
                 # Parse input
                 if user_input in ['y', 'yes', '1', 'true']:
@@ -201,10 +231,10 @@ class AkinatorGame:
                     return None  # Signal to quit/reveal answer
                 else:
                     # Invalid input - ask again
-                    print("   Please enter 'y' (yes), 'n' (no), 'p' (probably), 'pn' (probably not), 'dk' (don't know), 'guess', or 'quit': ", end="", flush=True)
+                    self._emit("   Please enter 'y' (yes), 'n' (no), 'p' (probably), 'pn' (probably not), 'dk' (don't know), 'guess', or 'quit': ", end="")
             except (EOFError, KeyboardInterrupt):
                 # User pressed Ctrl+C or EOF
-                print("\n")
+                self._emit("\n")
                 return None
     
     def _make_guess(self) -> bool:
@@ -218,29 +248,29 @@ class AkinatorGame:
         character, confidence = self.ai.get_best_guess()
         
         if not character:
-            print("\n🤔 I don't have enough information to make a guess.")
+            self._emit("\n🤔 I don't have enough information to make a guess.")
             return False
         
         # Display guess with confidence
         confidence_pct = confidence * 100
-        print(f"\n🎯 I think your character is: {character}")
-        print(f"   Confidence: {confidence_pct:.1f}%")
-        print("   Is this correct? (y/n): ", end="", flush=True)
+        self._emit(f"\n🎯 I think your character is: {character}")
+        self._emit(f"   Confidence: {confidence_pct:.1f}%")
+        self._emit("   Is this correct? (y/n): ", end="")
         
         # Get user response
         while True:
             try:
-                user_input = input().strip().lower()
+                user_input = self.io.read_line().strip().lower()
                 
                 if user_input in ['y', 'yes', '1', 'true', 'correct']:
                     return True
                 elif user_input in ['n', 'no', '0', 'false', 'incorrect', 'wrong']:
                     return False
                 else:
-                    print("   Please enter 'y' (yes) or 'n' (no): ", end="", flush=True)
+                    self._emit("   Please enter 'y' (yes) or 'n' (no): ", end="")
             except (EOFError, KeyboardInterrupt):
                 # User pressed Ctrl+C or EOF - treat as incorrect
-                print("\n")
+                self._emit("\n")
                 return False
     
     def _handle_correct_guess(self, character: str):
@@ -252,11 +282,11 @@ class AkinatorGame:
         """
         questions_asked = len(self.ai.asked_questions)
         
-        print("\n" + "=" * 60)
-        print("🎉 Correct! I guessed it!")
-        print(f"✅ Character: {character}")
-        print(f"📊 Questions asked: {questions_asked}")
-        print("=" * 60)
+        self._emit("\n" + "=" * 60)
+        self._emit("🎉 Correct! I guessed it!")
+        self._emit(f"✅ Character: {character}")
+        self._emit(f"📊 Questions asked: {questions_asked}")
+        self._emit("=" * 60)
     
     def _handle_wrong_guess(self, character: str):
         """
@@ -265,12 +295,12 @@ class AkinatorGame:
         Args:
             character: Name of the incorrectly guessed character
         """
-        print(f"\n❌ That's not correct. {character} is not the right answer.")
+        self._emit(f"\n❌ That's not correct. {character} is not the right answer.")
         
         # Penalize the wrong guess in the AI
         self.ai.penalize_wrong_guess(character)
         
-        print("   Let me ask more questions...\n")
+        self._emit("   Let me ask more questions...\n")
     
     def _reveal_answer(self) -> Optional[str]:
         """
@@ -279,15 +309,15 @@ class AkinatorGame:
         Returns:
             Character name if provided, None if cancelled
         """
-        print("\n🤔 What character were you thinking of?")
-        print("   (Enter character name, or 'cancel' to skip): ", end="", flush=True)
+        self._emit("\n🤔 What character were you thinking of?")
+        self._emit("   (Enter character name, or 'cancel' to skip): ", end="")
         
         while True:
             try:
-                user_input = input().strip()
+                user_input = self.io.read_line().strip()
                 
                 if not user_input:
-                    print("   Please enter a character name or 'cancel': ", end="", flush=True)
+                    self._emit("   Please enter a character name or 'cancel': ", end="")
                     continue
                 
                 if user_input.lower() in ['cancel', 'c', 'skip', 'none']:
@@ -299,12 +329,12 @@ class AkinatorGame:
                 if found_char:
                     return found_char
                 else:
-                    print(f"   Character '{user_input}' not found in database.")
-                    print("   Please try again or enter 'cancel': ", end="", flush=True)
+                    self._emit(f"   Character '{user_input}' not found in database.")
+                    self._emit("   Please try again or enter 'cancel': ", end="")
                     
             except (EOFError, KeyboardInterrupt):
                 # User pressed Ctrl+C or EOF
-                print("\n")
+                self._emit("\n")
                 return None
     
     def _play_again(self) -> bool:
@@ -314,21 +344,21 @@ class AkinatorGame:
         Returns:
             True if user wants to play again, False otherwise
         """
-        print("\n🔄 Would you like to play again? (y/n): ", end="", flush=True)
+        self._emit("\n🔄 Would you like to play again? (y/n): ", end="")
         
         while True:
             try:
-                user_input = input().strip().lower()
+                user_input = self.io.read_line().strip().lower()
                 
                 if user_input in ['y', 'yes', '1', 'true']:
                     return True
                 elif user_input in ['n', 'no', '0', 'false', 'quit', 'exit']:
                     return False
                 else:
-                    print("   Please enter 'y' (yes) or 'n' (no): ", end="", flush=True)
+                    self._emit("   Please enter 'y' (yes) or 'n' (no): ", end="")
             except (EOFError, KeyboardInterrupt):
                 # User pressed Ctrl+C or EOF - treat as no
-                print("\n")
+                self._emit("\n")
                 return False
     
     def _display_stats(self):
@@ -337,12 +367,12 @@ class AkinatorGame:
         """
         stats = self.ai.get_stats()
         
-        print(f"\n📊 [Q{stats['questions_asked']}] Top: {stats['top_character'][0]} ({stats['top_character'][1]*100:.1f}%) | "
-              f"Candidates: {stats['remaining_candidates']} | Entropy: {stats['entropy']:.2f} bits")
+        self._emit(f"\n📊 [Q{stats['questions_asked']}] Top: {stats['top_character'][0]} ({stats['top_character'][1]*100:.1f}%) | "
+                   f"Candidates: {stats['remaining_candidates']} | Entropy: {stats['entropy']:.2f} bits")
         
         # Show top 3 candidates in compact format
         if len(stats['top_5']) > 1:
             top_3 = stats['top_5'][:3]
             top_3_str = ", ".join([f"{char} ({prob*100:.0f}%)" for char, prob in top_3])
-            print(f"   Top 3: {top_3_str}")
+            self._emit(f"   Top 3: {top_3_str}")
 
@@ -9,8 +9,6 @@ from pathlib import Path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-from indinator import DecisionTreeAI, AkinatorGame
-
 
 def main():
     """Initialize and run the game."""
@@ -34,6 +32,9 @@ def main():
         return 1
     
     try:
+        # Imported here so NumPy/scikit-learn only load once we actually start a game
+        from indinator import DecisionTreeAI, AkinatorGame
+        
         # Initialize Decision Tree AI engine
         print("🔧 Initializing Decision Tree AI engine...")
         ai = DecisionTreeAI(
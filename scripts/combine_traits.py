@@ -7,17 +7,24 @@ from pathlib import Path
 # Add scripts directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from generate_identity_traits import get_identity_traits
-from generate_franchise_traits import get_franchise_traits
-from generate_appearance_traits import get_appearance_traits
-from generate_ability_traits import get_ability_traits
-from generate_role_traits import get_role_traits
-from generate_archetype_traits import get_archetype_traits
-from generate_personality_traits import get_personality_traits
+# Optional fast JSON serializer (falls back to stdlib json)
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 def combine_all_traits():
     """Combine all trait categories into a single dictionary."""
+    # Generators are imported lazily so importing this module stays cheap
+    from generate_identity_traits import get_identity_traits
+    from generate_franchise_traits import get_franchise_traits
+    from generate_appearance_traits import get_appearance_traits
+    from generate_ability_traits import get_ability_traits
+    from generate_role_traits import get_role_traits
+    from generate_archetype_traits import get_archetype_traits
+    from generate_personality_traits import get_personality_traits
+    
     identity_traits = get_identity_traits()
     franchise_traits = get_franchise_traits()
     appearance_traits = get_appearance_traits()
@@ -26,41 +33,59 @@ def combine_all_traits():
     archetype_traits = get_archetype_traits()
     personality_traits = get_personality_traits()
     
+    categories = [
+        ("identity", identity_traits),
+        ("franchise", franchise_traits),
+        ("appearance", appearance_traits),
+        ("abilities", ability_traits),
+        ("role", role_traits),
+        ("archetype", archetype_traits),
+        ("personality", personality_traits),
+    ]
+    
     # Get all character names
     all_characters = set()
-    for traits_dict in [identity_traits, franchise_traits, appearance_traits, 
-                        ability_traits, role_traits, archetype_traits, personality_traits]:
+    for _, traits_dict in categories:
         all_characters.update(traits_dict.keys())
     
-    # Combine traits for each character
-    combined_traits = {}
-    for character in sorted(all_characters):
-        combined_traits[character] = {
-            "identity": identity_traits.get(character, {}),
-            "franchise": franchise_traits.get(character, {}),
-            "appearance": appearance_traits.get(character, {}),
-            "abilities": ability_traits.get(character, {}),
-            "role": role_traits.get(character, {}),
-            "archetype": archetype_traits.get(character, {}),
-            "personality": personality_traits.get(character, {})
-        }
+    # Start every character with empty categories, then fill each category in one pass
+    combined_traits = {
+        character: {category: {} for category, _ in categories}
+        for character in sorted(all_characters)
+    }
+    # Identical trait sets share one dict; keyed on ordered items so output order is kept
+    trait_set_pool = {}
+    for category, traits_dict in categories:
+        for character, traits in traits_dict.items():
+            key = (category, tuple(traits.items()))
+            combined_traits[character][category] = trait_set_pool.setdefault(key, traits)
     
     return combined_traits
 
 
 def flatten_traits(nested_traits):
     """Flatten nested traits dict for easier ML processing."""
-    flat_traits = {}
-    for character, categories in nested_traits.items():
-        flat_traits[character] = {}
-        for category, traits in categories.items():
-            for trait_key, trait_value in traits.items():
-                # Prefix trait with category for clarity
-                flat_key = f"{category}_{trait_key}"
-                flat_traits[character][flat_key] = trait_value
+    # Prefix each trait with its category for clarity
+    flat_traits = {
+        character: {
+            f"{category}_{trait_key}": trait_value
+            for category, traits in categories.items()
+            for trait_key, trait_value in traits.items()
+        }
+        for character, categories in nested_traits.items()
+    }
     return flat_traits
 
 
+def save_json(obj, output_path):
+    """Write obj as indented UTF-8 JSON, using orjson when available."""
+    if orjson is not None:
+        Path(output_path).write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+        return
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(obj, f, indent=2, ensure_ascii=False)
+
+
 if __name__ == "__main__":
     # Combine all traits
     print("Combining all trait categories...")
@@ -70,8 +95,7 @@ if __name__ == "__main__":
     output_path = Path(__file__).parent.parent / "data" / "traits.json"
     output_path.parent.mkdir(exist_ok=True)
     
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(combined, f, indent=2, ensure_ascii=False)
+    save_json(combined, output_path)
     
     print(f"✓ Saved nested traits to {output_path}")
     
@@ -79,8 +103,7 @@ if __name__ == "__main__":
     flat_output_path = Path(__file__).parent.parent / "data" / "traits_flat.json"
     flat_traits = flatten_traits(combined)
     
-    with open(flat_output_path, 'w', encoding='utf-8') as f:
-        json.dump(flat_traits, f, indent=2, ensure_ascii=False)
+    save_json(flat_traits, flat_output_path)
     
     print(f"✓ Saved flattened traits to {flat_output_path}")
     
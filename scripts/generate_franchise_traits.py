@@ -1,158 +1,203 @@
 """Generate franchise/universe traits for all characters."""
 
+# Shared trait set for each franchise (characters in a franchise reference the same dict)
+FRANCHISE_GROUPS = {
+    "harry_potter": {"franchise_harry_potter": 1},
+    "star_wars": {"franchise_star_wars": 1},
+    "lotr": {"franchise_lotr": 1},
+    "hunger_games": {"franchise_hunger_games": 1},
+    "sherlock": {"franchise_sherlock": 1},
+    "james_bond": {"franchise_james_bond": 1},
+    "indiana_jones": {"franchise_indiana_jones": 1},
+    "dc": {"franchise_dc": 1},
+    "marvel": {"franchise_marvel": 1},
+    "naruto": {"franchise_naruto": 1, "anime": 1},
+    "one_piece": {"franchise_one_piece": 1, "anime": 1},
+    "death_note": {"franchise_death_note": 1, "anime": 1},
+    "dragon_ball": {"franchise_dragon_ball": 1, "anime": 1},
+    "pokemon": {"franchise_pokemon": 1, "anime": 1},
+    "mario": {"franchise_mario": 1, "nintendo": 1, "video_game": 1},
+    "zelda": {"franchise_zelda": 1, "nintendo": 1, "video_game": 1},
+    "god_of_war": {"franchise_god_of_war": 1, "video_game": 1},
+    "halo": {"franchise_halo": 1, "video_game": 1},
+    "witcher": {"franchise_witcher": 1, "video_game": 1},
+    "aot": {"franchise_aot": 1, "anime": 1},
+    "walking_dead": {"franchise_walking_dead": 1, "tv_show": 1},
+    "simpsons": {"franchise_simpsons": 1, "tv_show": 1},
+    "spongebob": {"franchise_spongebob": 1, "tv_show": 1},
+    "shrek": {"franchise_shrek": 1, "movie": 1},
+    "frozen": {"franchise_frozen": 1, "disney": 1, "movie": 1},
+    "avatar": {"franchise_avatar": 1, "tv_show": 1},
+    "breaking_bad": {"franchise_breaking_bad": 1, "tv_show": 1},
+    "stranger_things": {"franchise_stranger_things": 1, "tv_show": 1},
+    "got": {"franchise_got": 1, "tv_show": 1},
+    "sonic": {"franchise_sonic": 1, "video_game": 1},
+    "tomb_raider": {"franchise_tomb_raider": 1, "video_game": 1},
+    "uncharted": {"franchise_uncharted": 1, "video_game": 1},
+    "tlou": {"franchise_tlou": 1, "video_game": 1},
+}
+
+# Franchise group for each character
+CHARACTER_FRANCHISE = {
+    # Harry Potter Universe
+    "Harry Potter": "harry_potter",
+    "Hermione Granger": "harry_potter",
+    "Ron Weasley": "harry_potter",
+    "Albus Dumbledore": "harry_potter",
+    
+    # Star Wars
+    "Darth Vader": "star_wars",
+    "Luke Skywalker": "star_wars",
+    "Princess Leia": "star_wars",
+    "Han Solo": "star_wars",
+    
+    # Lord of the Rings
+    "Frodo Baggins": "lotr",
+    "Gandalf": "lotr",
+    "Aragorn": "lotr",
+    "Legolas": "lotr",
+    "Bilbo Baggins": "lotr",
+    
+    # Hunger Games
+    "Katniss Everdeen": "hunger_games",
+    "Peeta Mellark": "hunger_games",
+    "President Snow": "hunger_games",
+    
+    # Detective/Spy
+    "Sherlock Holmes": "sherlock",
+    "John Watson": "sherlock",
+    "James Bond": "james_bond",
+    "Indiana Jones": "indiana_jones",
+    
+    # DC Comics
+    "Batman": "dc",
+    "Superman": "dc",
+    "Wonder Woman": "dc",
+    "The Joker": "dc",
+    "Harley Quinn": "dc",
+    
+    # Marvel
+    "Spider-Man": "marvel",
+    "Iron Man": "marvel",
+    "Captain America": "marvel",
+    "Hulk": "marvel",
+    "Thor": "marvel",
+    "Black Widow": "marvel",
+    "Loki": "marvel",
+    "Thanos": "marvel",
+    
+    # Naruto
+    "Naruto Uzumaki": "naruto",
+    "Sasuke Uchiha": "naruto",
+    "Sakura Haruno": "naruto",
+    "Kakashi Hatake": "naruto",
+    
+    # One Piece
+    "Monkey D. Luffy": "one_piece",
+    "Roronoa Zoro": "one_piece",
+    "Nami": "one_piece",
+    "Sanji": "one_piece",
+    
+    # Death Note
+    "Light Yagami": "death_note",
+    "L Lawliet": "death_note",
+    
+    # Dragon Ball
+    "Goku": "dragon_ball",
+    "Vegeta": "dragon_ball",
+    "Piccolo": "dragon_ball",
+    
+    # Pokemon
+    "Ash Ketchum": "pokemon",
+    "Pikachu": "pokemon",
+    
+    # Nintendo
+    "Mario": "mario",
+    "Luigi": "mario",
+    "Princess Peach": "mario",
+    "Bowser": "mario",
+    "Link": "zelda",
+    "Zelda": "zelda",
+    "Ganondorf": "zelda",
+    
+    # Video Games
+    "Kratos": "god_of_war",
+    "Atreus": "god_of_war",
+    "Master Chief": "halo",
+    "Cortana": "halo",
+    "Geralt of Rivia": "witcher",
+    "Yennefer": "witcher",
+    "Ciri": "witcher",
+    
+    # Attack on Titan
+    "Eren Yeager": "aot",
+    "Mikasa Ackerman": "aot",
+    "Armin Arlert": "aot",
+    "Levi Ackerman": "aot",
+    
+    # Walking Dead
+    "Rick Grimes": "walking_dead",
+    "Michonne": "walking_dead",
+    
+    # Simpsons
+    "Homer Simpson": "simpsons",
+    "Bart Simpson": "simpsons",
+    "Lisa Simpson": "simpsons",
+    
+    # SpongeBob
+    "SpongeBob SquarePants": "spongebob",
+    "Patrick Star": "spongebob",
+    "Squidward Tentacles": "spongebob",
+    
+    # Shrek
+    "Shrek": "shrek",
+    "Donkey": "shrek",
+    "Fiona": "shrek",
+    
+    # Frozen
+    "Elsa": "frozen",
+    "Anna": "frozen",
+    "Olaf": "frozen",
+    
+    # Avatar
+    "Aang": "avatar",
+    "Zuko": "avatar",
+    "Katara": "avatar",
+    "Sokka": "avatar",
+    
+    # Breaking Bad
+    "Walter White": "breaking_bad",
+    "Jesse Pinkman": "breaking_bad",
+    "Saul Goodman": "breaking_bad",
+    
+    # Stranger Things
+    "Eleven": "stranger_things",
+    "Mike Wheeler": "stranger_things",
+    "Vecna": "stranger_things",
+    
+    # Game of Thrones
+    "Jon Snow": "got",
+    "Daenerys Targaryen": "got",
+    "Tyrion Lannister": "got",
+    "Arya Stark": "got",
+    
+    # Sonic
+    "Sonic the Hedgehog": "sonic",
+    "Dr. Eggman": "sonic",
+    
+    # Adventure Games
+    "Lara Croft": "tomb_raider",
+    "Nathan Drake": "uncharted",
+    "Joel Miller": "tlou",
+    "Ellie Williams": "tlou",
+}
+
+FRANCHISE_TRAITS = {
+    character: FRANCHISE_GROUPS[group]
+    for character, group in CHARACTER_FRANCHISE.items()
+}
+
+
 def get_franchise_traits():
     """Return franchise traits for each character."""
-    return {
-        # Harry Potter Universe
-        "Harry Potter": {"franchise_harry_potter": 1},
-        "Hermione Granger": {"franchise_harry_potter": 1},
-        "Ron Weasley": {"franchise_harry_potter": 1},
-        "Albus Dumbledore": {"franchise_harry_potter": 1},
-        
-        # Star Wars
-        "Darth Vader": {"franchise_star_wars": 1},
-        "Luke Skywalker": {"franchise_star_wars": 1},
-        "Princess Leia": {"franchise_star_wars": 1},
-        "Han Solo": {"franchise_star_wars": 1},
-        
-        # Lord of the Rings
-        "Frodo Baggins": {"franchise_lotr": 1},
-        "Gandalf": {"franchise_lotr": 1},
-        "Aragorn": {"franchise_lotr": 1},
-        "Legolas": {"franchise_lotr": 1},
-        "Bilbo Baggins": {"franchise_lotr": 1},
-        
-        # Hunger Games
-        "Katniss Everdeen": {"franchise_hunger_games": 1},
-        "Peeta Mellark": {"franchise_hunger_games": 1},
-        "President Snow": {"franchise_hunger_games": 1},
-        
-        # Detective/Spy
-        "Sherlock Holmes": {"franchise_sherlock": 1},
-        "John Watson": {"franchise_sherlock": 1},
-        "James Bond": {"franchise_james_bond": 1},
-        "Indiana Jones": {"franchise_indiana_jones": 1},
-        
-        # DC Comics
-        "Batman": {"franchise_dc": 1},
-        "Superman": {"franchise_dc": 1},
-        "Wonder Woman": {"franchise_dc": 1},
-        "The Joker": {"franchise_dc": 1},
-        "Harley Quinn": {"franchise_dc": 1},
-        
-        # Marvel
-        "Spider-Man": {"franchise_marvel": 1},
-        "Iron Man": {"franchise_marvel": 1},
-        "Captain America": {"franchise_marvel": 1},
-        "Hulk": {"franchise_marvel": 1},
-        "Thor": {"franchise_marvel": 1},
-        "Black Widow": {"franchise_marvel": 1},
-        "Loki": {"franchise_marvel": 1},
-        "Thanos": {"franchise_marvel": 1},
-        
-        # Naruto
-        "Naruto Uzumaki": {"franchise_naruto": 1, "anime": 1},
-        "Sasuke Uchiha": {"franchise_naruto": 1, "anime": 1},
-        "Sakura Haruno": {"franchise_naruto": 1, "anime": 1},
-        "Kakashi Hatake": {"franchise_naruto": 1, "anime": 1},
-        
-        # One Piece
-        "Monkey D. Luffy": {"franchise_one_piece": 1, "anime": 1},
-        "Roronoa Zoro": {"franchise_one_piece": 1, "anime": 1},
-        "Nami": {"franchise_one_piece": 1, "anime": 1},
-        "Sanji": {"franchise_one_piece": 1, "anime": 1},
-        
-        # Death Note
-        "Light Yagami": {"franchise_death_note": 1, "anime": 1},
-        "L Lawliet": {"franchise_death_note": 1, "anime": 1},
-        
-        # Dragon Ball
-        "Goku": {"franchise_dragon_ball": 1, "anime": 1},
-        "Vegeta": {"franchise_dragon_ball": 1, "anime": 1},
-        "Piccolo": {"franchise_dragon_ball": 1, "anime": 1},
-        
-        # Pokemon
-        "Ash Ketchum": {"franchise_pokemon": 1, "anime": 1},
-        "Pikachu": {"franchise_pokemon": 1, "anime": 1},
-        
-        # Nintendo
-        "Mario": {"franchise_mario": 1, "nintendo": 1, "video_game": 1},
-        "Luigi": {"franchise_mario": 1, "nintendo": 1, "video_game": 1},
-        "Princess Peach": {"franchise_mario": 1, "nintendo": 1, "video_game": 1},
-        "Bowser": {"franchise_mario": 1, "nintendo": 1, "video_game": 1},
-        "Link": {"franchise_zelda": 1, "nintendo": 1, "video_game": 1},
-        "Zelda": {"franchise_zelda": 1, "nintendo": 1, "video_game": 1},
-        "Ganondorf": {"franchise_zelda": 1, "nintendo": 1, "video_game": 1},
-        
-        # Video Games
-        "Kratos": {"franchise_god_of_war": 1, "video_game": 1},
-        "Atreus": {"franchise_god_of_war": 1, "video_game": 1},
-        "Master Chief": {"franchise_halo": 1, "video_game": 1},
-        "Cortana": {"franchise_halo": 1, "video_game": 1},
-        "Geralt of Rivia": {"franchise_witcher": 1, "video_game": 1},
-        "Yennefer": {"franchise_witcher": 1, "video_game": 1},
-        "Ciri": {"franchise_witcher": 1, "video_game": 1},
-        
-        # Attack on Titan
-        "Eren Yeager": {"franchise_aot": 1, "anime": 1},
-        "Mikasa Ackerman": {"franchise_aot": 1, "anime": 1},
-        "Armin Arlert": {"franchise_aot": 1, "anime": 1},
-        "Levi Ackerman": {"franchise_aot": 1, "anime": 1},
-        
-        # Walking Dead
-        "Rick Grimes": {"franchise_walking_dead": 1, "tv_show": 1},
-        "Michonne": {"franchise_walking_dead": 1, "tv_show": 1},
-        
-        # Simpsons
-        "Homer Simpson": {"franchise_simpsons": 1, "tv_show": 1},
-        "Bart Simpson": {"franchise_simpsons": 1, "tv_show": 1},
-        "Lisa Simpson": {"franchise_simpsons": 1, "tv_show": 1},
-        
-        # SpongeBob
-        "SpongeBob SquarePants": {"franchise_spongebob": 1, "tv_show": 1},
-        "Patrick Star": {"franchise_spongebob": 1, "tv_show": 1},
-        "Squidward Tentacles": {"franchise_spongebob": 1, "tv_show": 1},
-        
-        # Shrek
-        "Shrek": {"franchise_shrek": 1, "movie": 1},
-        "Donkey": {"franchise_shrek": 1, "movie": 1},
-        "Fiona": {"franchise_shrek": 1, "movie": 1},
-        
-        # Frozen
-        "Elsa": {"franchise_frozen": 1, "disney": 1, "movie": 1},
-        "Anna": {"franchise_frozen": 1, "disney": 1, "movie": 1},
-        "Olaf": {"franchise_frozen": 1, "disney": 1, "movie": 1},
-        
-        # Avatar
-        "Aang": {"franchise_avatar": 1, "tv_show": 1},
-        "Zuko": {"franchise_avatar": 1, "tv_show": 1},
-        "Katara": {"franchise_avatar": 1, "tv_show": 1},
-        "Sokka": {"franchise_avatar": 1, "tv_show": 1},
-        
-        # Breaking Bad
-        "Walter White": {"franchise_breaking_bad": 1, "tv_show": 1},
-        "Jesse Pinkman": {"franchise_breaking_bad": 1, "tv_show": 1},
-        "Saul Goodman": {"franchise_breaking_bad": 1, "tv_show": 1},
-        
-        # Stranger Things
-        "Eleven": {"franchise_stranger_things": 1, "tv_show": 1},
-        "Mike Wheeler": {"franchise_stranger_things": 1, "tv_show": 1},
-        "Vecna": {"franchise_stranger_things": 1, "tv_show": 1},
-        
-        # Game of Thrones
-        "Jon Snow": {"franchise_got": 1, "tv_show": 1},
-        "Daenerys Targaryen": {"franchise_got": 1, "tv_show": 1},
-        "Tyrion Lannister": {"franchise_got": 1, "tv_show": 1},
-        "Arya Stark": {"franchise_got": 1, "tv_show": 1},
-        
-        # Sonic
-        "Sonic the Hedgehog": {"franchise_sonic": 1, "video_game": 1},
-        "Dr. Eggman": {"franchise_sonic": 1, "video_game": 1},
-        
-        # Adventure Games
-        "Lara Croft": {"franchise_tomb_raider": 1, "video_game": 1},
-        "Nathan Drake": {"franchise_uncharted": 1, "video_game": 1},
-        "Joel Miller": {"franchise_tlou": 1, "video_game": 1},
-        "Ellie Williams": {"franchise_tlou": 1, "video_game": 1},
-    }
-
+    return FRANCHISE_TRAITS
@@ -1,10 +1,48 @@
 import json
-import re
+
+# Optional fast JSON parser (falls back to stdlib json)
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 INPUT_FILE = "../data/traits_flat.json"
 OUTPUT_FILE = "../data/questions.json"
 
 
+# ------------------------------------------------
+# Question templates
+# ------------------------------------------------
+# Keyed on (group, trait prefix); "{}" receives the rest of the trait name
+PREFIX_TEMPLATES = {
+    ("appearance", "has"): "Does your character have {}?",
+    ("appearance", "hair"): "Does your character have {} hair?",
+    ("appearance", "color"): "Is your character associated with the color {}?",
+    ("appearance", "height"): "Is your character {} in height?",
+    ("identity", "species"): "Is your character a {}?",
+    ("identity", "age"): "Is your character {}?",
+    ("identity", "origin"): "Does your character originate from {}?",
+    ("identity", "alignment"): "Is your character generally {}?",
+}
+
+GENDER_QUESTIONS = {
+    "m": "Is your character male?",
+    "f": "Is your character female?",
+}
+
+# Per-group default; "{}" receives the whole trait name
+GROUP_TEMPLATES = {
+    "appearance": "Is your character {}?",
+    "identity": "Is your character {}?",
+    "abilities": "Does your character have the ability '{}'?",
+    "role": "Does your character play the role of a {}?",
+    "archetype": "Is your character an example of a {} archetype?",
+    "personality": "Is your character {}?",
+}
+
+FALLBACK_TEMPLATE = "Does your character have the trait '{}'?"
+
+
 # ------------------------------------------------
 # Helper: Generate natural-language question string
 # ------------------------------------------------
@@ -13,64 +51,25 @@ def trait_to_question(trait):
     Convert a raw trait key into a natural-language question.
     Trait format: group_traitname e.g. appearance_has_sword
     """
-
     group, raw = trait.split("_", 1)
-    raw_pretty = raw.replace("_", " ")
-
-    # ---- APPEARANCE ----
-    if group == "appearance":
-        if raw.startswith("has_"):
-            return f"Does your character have {raw_pretty[4:]}?"
-        if raw.startswith("hair_"):
-            return f"Does your character have {raw_pretty[5:]} hair?"
-        if raw.startswith("color_"):
-            return f"Is your character associated with the color {raw_pretty[6:]}?"
-        if raw.startswith("height_"):
-            return f"Is your character {raw_pretty[7:]} in height?"
-        return f"Is your character {raw_pretty}?"
-
-    # ---- IDENTITY ----
-    if group == "identity":
-        if raw.startswith("gender_"):
-            gender = raw.split("_")[1]
-            if gender == "m":
-                return "Is your character male?"
-            if gender == "f":
-                return "Is your character female?"
-            return f"Does your character identify as {gender}?"
-        if raw.startswith("species_"):
-            return f"Is your character a {raw_pretty[8:]}?"
-        if raw.startswith("age_"):
-            return f"Is your character {raw_pretty[4:]}?"
-        if raw.startswith("origin_"):
-            return f"Does your character originate from {raw_pretty[7:]}?"
-        if raw.startswith("alignment_"):
-            return f"Is your character generally {raw_pretty[10:]}?"
-        return f"Is your character {raw_pretty}?"
-
-    # ---- FRANCHISE ----
-    if group == "franchise":
-        cleaned = raw_pretty.replace("franchise ", "")
-        return f"Is your character from {cleaned}?"
-
-    # ---- ABILITIES ----
-    if group == "abilities":
-        return f"Does your character have the ability '{raw_pretty}'?"
+    return group_trait_to_question(group, raw)
 
-    # ---- ROLE ----
-    if group == "role":
-        return f"Does your character play the role of a {raw_pretty}?"
 
-    # ---- ARCHETYPE ----
-    if group == "archetype":
-        return f"Is your character an example of a {raw_pretty} archetype?"
+def group_trait_to_question(group, raw):
+    """Build the question for a trait already split into (group, traitname)."""
+    prefix, sep, rest = raw.partition("_")
+    if sep:
+        if group == "identity" and prefix == "gender":
+            gender = rest.split("_")[0]
+            return GENDER_QUESTIONS.get(gender, f"Does your character identify as {gender}?")
+        template = PREFIX_TEMPLATES.get((group, prefix))
+        if template:
+            return template.format(rest.replace("_", " "))
 
-    # ---- PERSONALITY ----
-    if group == "personality":
-        return f"Is your character {raw_pretty}?"
-
-    # ---- FALLBACK ----
-    return f"Does your character have the trait '{raw_pretty}'?"
+    raw_pretty = raw.replace("_", " ")
+    if group == "franchise":
+        return f"Is your character from {raw_pretty.replace('franchise ', '')}?"
+    return GROUP_TEMPLATES.get(group, FALLBACK_TEMPLATE).format(raw_pretty)
 
 
 # ------------------------------------------------
@@ -78,36 +77,35 @@ def trait_to_question(trait):
 # ------------------------------------------------
 def main():
     print("Loading traits...")
-    with open(INPUT_FILE, "r") as f:
-        traits_data = json.load(f)
+    with open(INPUT_FILE, "rb") as f:
+        raw_bytes = f.read()
+    traits_data = orjson.loads(raw_bytes) if orjson is not None else json.loads(raw_bytes)
 
     # Collect all trait keys from all characters
     print("Extracting trait keys...")
-    all_traits = set()
-    for character, traits in traits_data.items():
-        for trait in traits.keys():
-            all_traits.add(trait)
+    all_traits = set().union(*traits_data.values())
 
     print(f"Found {len(all_traits)} unique traits.")
 
-    questions = []
-
-    # Convert each trait into a question entry
-    print("Generating questions...")
-    for trait in sorted(all_traits):
-        group = trait.split("_")[0]  # identity / appearance / etc.
-        question = trait_to_question(trait)
-
-        questions.append({
-            "trait": trait,
-            "group": group,
-            "question": question
-        })
-
-    # Save output JSON
-    print(f"Writing to {OUTPUT_FILE}...")
+    # Convert each trait into a question entry and stream it straight to disk
+    # (same layout as json.dump(questions, f, indent=4), without holding the list)
+    print(f"Generating questions into {OUTPUT_FILE}...")
     with open(OUTPUT_FILE, "w") as f:
-        json.dump(questions, f, indent=4)
+        first = True
+        for trait in sorted(all_traits):
+            group, raw = trait.split("_", 1)  # identity / appearance / etc.
+            question = group_trait_to_question(group, raw)
+
+            entry = {
+                "trait": trait,
+                "group": group,
+                "question": question
+            }
+            f.write("[\n    " if first else ",\n    ")
+            f.write(json.dumps(entry, indent=4).replace("\n", "\n    "))
+            first = False
+
+        f.write("[]" if first else "\n]")
 
     print("Done! questions.json has been created.")
 
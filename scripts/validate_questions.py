@@ -5,17 +5,30 @@ Ensures all questions have positive and negative examples.
 
 import json
 import sys
+from collections import Counter
 from pathlib import Path
 
+# Optional fast JSON parser (falls back to stdlib json)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _load_json(filepath: str):
+    """Load a JSON file, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(Path(filepath).read_bytes())
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
 def validate_questions(questions_file: str, traits_file: str):
     """Validate questions against character traits."""
     
     # Load data
-    with open(questions_file, 'r', encoding='utf-8') as f:
-        questions_data = json.load(f)
-    
-    with open(traits_file, 'r', encoding='utf-8') as f:
-        traits_data = json.load(f)
+    questions_data = _load_json(questions_file)
+    traits_data = _load_json(traits_file)
     
     # Handle both array and object with "questions" key
     if isinstance(questions_data, dict) and 'questions' in questions_data:
@@ -40,20 +53,20 @@ def validate_questions(questions_file: str, traits_file: str):
         'missing_trait': []
     }
     
+    # Count, in one pass over the characters, how many list each trait and how many have it
+    trait_present = Counter()
+    trait_positive = Counter()
+    for char_traits in traits_data.values():
+        trait_present.update(char_traits.keys())
+        trait_positive.update(trait for trait, value in char_traits.items() if value == 1)
+    
     for q in questions:
         trait = q.get('trait', '')
         if not trait:
             continue
         
-        # Count positive examples
-        positive_count = 0
-        trait_exists = False
-        
-        for char, char_traits in traits_data.items():
-            if trait in char_traits:
-                trait_exists = True
-                if char_traits.get(trait, 0) == 1:
-                    positive_count += 1
+        trait_exists = trait in trait_present
+        positive_count = trait_positive[trait]
         
         negative_count = num_characters - positive_count
         positive_pct = (positive_count / num_characters * 100) if num_characters > 0 else 0
@@ -0,0 +1,31 @@
+"""
+Shared fixtures for the Indinator test suite.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Make project root importable
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from indinator import DecisionTreeAI
+
+
+@pytest.fixture(scope="session")
+def engine():
+    """One trained engine for the whole run (training is the slow part)."""
+    return DecisionTreeAI(
+        traits_file=str(PROJECT_ROOT / "data" / "traits_flat.json"),
+        questions_file=str(PROJECT_ROOT / "data" / "questions.json"),
+    )
+
+
+@pytest.fixture
+def ai(engine):
+    """The shared engine, reset to a fresh game for each test."""
+    engine.reset()
+    return engine
@@ -0,0 +1,132 @@
+"""
+Behaviour tests for DecisionTreeAI game state: probability updates, top-K
+ranking, guessing, wrong-guess penalties and reset.
+"""
+
+import numpy as np
+import pytest
+
+
+def truthful_answer(ai, character, q_idx):
+    """Answer a question the way someone thinking of `character` would."""
+    trait = ai.questions[q_idx]["trait"]
+    has_trait = ai.feature_extractor.traits[character].get(trait, 0) == 1
+    return "yes" if has_trait else "no"
+
+
+def play(ai, character, max_questions=30, threshold=0.75):
+    """
+    Replay a game with truthful answers until the engine is ready to guess.
+
+    Returns:
+        List of (question_idx, answer, probabilities copy) per turn
+    """
+    turns = []
+    for step in range(max_questions):
+        if step >= 5 and ai.should_make_guess(threshold=threshold):
+            break
+        q_idx = ai.select_best_question()
+        if q_idx is None:
+            break
+        answer = truthful_answer(ai, character, q_idx)
+        ai.update_probabilities(q_idx, answer)
+        turns.append((q_idx, answer, ai.probabilities.copy()))
+    return turns
+
+
+def test_reset_gives_uniform_distribution(ai):
+    n = ai.num_characters
+    assert ai.probabilities.shape == (n,)
+    assert np.allclose(ai.probabilities, 1.0 / n)
+    assert not ai.known_mask.any()
+    assert (ai.current_feature_vector == -1).all()
+    assert ai.asked_questions == set()
+    assert ai.question_history == []
+
+
+def test_update_probabilities_favours_matching_characters(ai):
+    q_idx = ai.select_best_question()
+    trait = ai.questions[q_idx]["trait"]
+    ai.update_probabilities(q_idx, "yes")
+
+    has_trait = np.array([
+        ai.feature_extractor.traits[c].get(trait, 0) == 1 for c in ai.characters
+    ])
+    assert has_trait.any() and not has_trait.all()
+    assert ai.probabilities.sum() == pytest.approx(1.0)
+    assert ai.probabilities[has_trait].min() > ai.probabilities[~has_trait].max()
+    assert q_idx in ai.asked_questions
+
+
+def test_dont_know_leaves_probabilities_unchanged(ai):
+    q_idx = ai.select_best_question()
+    ai.update_probabilities(q_idx, "yes")
+    before = ai.probabilities.copy()
+
+    other = ai.select_best_question()
+    ai.update_probabilities(other, "dont_know")
+
+    assert np.array_equal(ai.probabilities, before)
+    assert other in ai.asked_questions
+
+
+def test_get_top_characters_matches_full_sort(ai):
+    play(ai, ai.characters[0], max_questions=4)
+
+    top = ai.get_top_characters(5)
+    expected = sorted(zip(ai.characters, ai.probabilities.tolist()),
+                      key=lambda item: item[1], reverse=True)[:5]
+
+    assert [p for _, p in top] == [p for _, p in expected]
+    assert all(type(p) is float for _, p in top)
+    assert top[0] == ai.get_best_guess()
+
+
+def test_should_make_guess_false_on_fresh_game(ai):
+    assert ai.should_make_guess(threshold=0.75) is False
+
+
+@pytest.mark.parametrize("char_idx", [0, 37, 74, 111, 149])
+def test_truthful_game_guesses_the_character(ai, char_idx):
+    character = ai.characters[char_idx]
+    play(ai, character)
+
+    assert ai.should_make_guess(threshold=0.75)
+    assert ai.get_best_guess()[0] == character
+
+
+def test_penalize_wrong_guess_demotes_character(ai):
+    play(ai, ai.characters[0], max_questions=6)
+    best, best_prob = ai.get_best_guess()
+    entropy_before = ai.get_stats()["entropy"]
+
+    ai.penalize_wrong_guess(best, penalty_factor=0.01)
+
+    idx = ai.characters.index(best)
+    assert ai.probabilities.sum() == pytest.approx(1.0)
+    assert ai.probabilities[idx] < best_prob
+    assert ai.get_best_guess()[0] != best
+    # Cached entropy/snapshot must follow the in-place update
+    assert ai.get_stats()["entropy"] != entropy_before
+    assert ai.snapshot()["top_idx"] == int(np.argmax(ai.probabilities))
+
+
+def test_penalize_unknown_character_is_ignored(ai):
+    before = ai.probabilities.copy()
+    ai.penalize_wrong_guess("Not A Real Character")
+    assert np.array_equal(ai.probabilities, before)
+
+
+def test_reset_replays_identically(ai):
+    character = ai.characters[42]
+    first = play(ai, character)
+    ai.penalize_wrong_guess(ai.get_best_guess()[0])
+
+    ai.reset()
+    assert np.allclose(ai.probabilities, 1.0 / ai.num_characters)
+    assert ai.entropy(ai.probabilities) == pytest.approx(np.log2(ai.num_characters))
+
+    second = play(ai, character)
+    assert [(q, a) for q, a, _ in first] == [(q, a) for q, a, _ in second]
+    for (_, _, p1), (_, _, p2) in zip(first, second):
+        assert np.array_equal(p1, p2)
@@ -4,13 +4,14 @@ Run with:  python3 ui/gui_pyqt.py
 """
 
 import sys
+from functools import partial
 from pathlib import Path
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QLabel, QPushButton,
     QVBoxLayout, QHBoxLayout, QMessageBox, QSizePolicy
 )
 from PyQt5.QtGui import QPixmap
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QObject, QThread, pyqtSignal, pyqtSlot
 
 # Make project root importable
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
@@ -19,8 +20,70 @@ if str(PROJECT_ROOT) not in sys.path:
 
 from indinator import AkinatorAI
 
+# Guess confidence threshold by number of questions asked (index = questions asked)
+GUESS_THRESHOLDS = tuple(
+    0.75 if q <= 5 else 0.65 if q <= 12 else 0.55 if q <= 18 else 0.45
+    for q in range(20)
+)
+
+
+class EngineWorker(QObject):
+    """
+    Runs AkinatorAI question selection and probability updates on a worker
+    thread so the window keeps repainting while the engine is busy.
+    Results come back to the GUI through signals.
+    """
+
+    question_ready = pyqtSignal(int, str)  # question index, question text
+    guess_ready = pyqtSignal(str, float)   # character, probability
+
+    def __init__(self, ai):
+        super().__init__()
+        self.ai = ai
+
+    @pyqtSlot()
+    def on_next_requested(self):
+        q_idx = self.ai.select_best_question(focus_top_n=10)
+        if q_idx is None:
+            self.on_guess_requested()
+            return
+        self.question_ready.emit(q_idx, self.ai.questions[q_idx]["question"])
+
+    @pyqtSlot()
+    def on_guess_requested(self):
+        character, prob = self.ai.get_best_guess()
+        self.guess_ready.emit(character, float(prob))
+
+    @pyqtSlot(object, object, float)
+    def on_answer_received(self, q_idx, ans, threshold):
+        # ans is None for "Don't Know", which leaves probabilities untouched
+        if ans is not None:
+            self.ai.update_probabilities(q_idx, bool(ans))
+        if self.ai.should_make_guess(threshold=threshold):
+            self.on_guess_requested()
+        else:
+            self.on_next_requested()
+
+    @pyqtSlot(str, bool)
+    def on_wrong_guess(self, character, guess_again):
+        # Penalize wrong guess lightly and try again
+        try:
+            self.ai.penalize_wrong_guess(character, penalty_factor=0.001)
+        except Exception:
+            pass
+        if guess_again:
+            self.on_guess_requested()
+        else:
+            self.on_next_requested()
+
 
 class IndinatorGUI(QWidget):
+    # Requests handled by EngineWorker on the engine thread
+    request_next = pyqtSignal()
+    request_guess = pyqtSignal()
+    answer_received = pyqtSignal(object, object, float)
+    wrong_guess = pyqtSignal(str, bool)
+
     def __init__(self):
         super().__init__()
 
@@ -56,6 +119,18 @@ class IndinatorGUI(QWidget):
             characters_file=str(PROJECT_ROOT / "data" / "characters.json"),
         )
 
+        # --- Engine worker thread ---
+        self.engine_thread = QThread(self)
+        self.engine_worker = EngineWorker(self.ai)
+        self.engine_worker.moveToThread(self.engine_thread)
+        self.request_next.connect(self.engine_worker.on_next_requested)
+        self.request_guess.connect(self.engine_worker.on_guess_requested)
+        self.answer_received.connect(self.engine_worker.on_answer_received)
+        self.wrong_guess.connect(self.engine_worker.on_wrong_guess)
+        self.engine_worker.question_ready.connect(self.show_question)
+        self.engine_worker.guess_ready.connect(self.show_guess)
+        self.engine_thread.start()
+
         # --- Game state ---
         self.current_question_idx = None
         self.questions_asked = 0
@@ -69,6 +144,12 @@ class IndinatorGUI(QWidget):
         self.pix_thinking = QPixmap(str(assets_dir / "char_thinking.png"))
         self.pix_skeptical = QPixmap(str(assets_dir / "char_skeptical.png"))
 
+        # Scale each pose once here so set_expression only swaps pixmaps
+        self.pix_happy, self.pix_worried, self.pix_thinking, self.pix_skeptical = (
+            pix if pix.isNull() else pix.scaled(320, 320, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            for pix in (self.pix_happy, self.pix_worried, self.pix_thinking, self.pix_skeptical)
+        )
+
         # --- Layout: character on left, speech card on right ---
         root_layout = QHBoxLayout()
         root_layout.setContentsMargins(20, 20, 20, 20)
@@ -121,9 +202,9 @@ class IndinatorGUI(QWidget):
         self.no_btn = QPushButton("No")
         self.skip_btn = QPushButton("Don't Know")
 
-        self.yes_btn.clicked.connect(lambda: self.on_answer(True))
-        self.no_btn.clicked.connect(lambda: self.on_answer(False))
-        self.skip_btn.clicked.connect(lambda: self.on_answer(None))
+        self.yes_btn.clicked.connect(partial(self.on_answer, True))
+        self.no_btn.clicked.connect(partial(self.on_answer, False))
+        self.skip_btn.clicked.connect(partial(self.on_answer, None))
 
         for b in (self.yes_btn, self.no_btn, self.skip_btn):
             b.setFixedWidth(140)
@@ -177,12 +258,12 @@ class IndinatorGUI(QWidget):
             pix = self.pix_happy
 
         if not pix.isNull():
-            scaled = pix.scaled(320, 320, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            self.char_label.setPixmap(scaled)
+            self.char_label.setPixmap(pix)
 
     # ------------ Game flow ------------
 
     def start_new_game(self):
+        # Safe on the GUI thread: New Game is disabled while the worker is busy
         self.ai.reset()
         self.mode = "asking"
         self.questions_asked = 0
@@ -190,7 +271,6 @@ class IndinatorGUI(QWidget):
 
         self.status_label.setText("Game started! Answer truthfully 🙂")
         self.speech_label.setText("I'm ready. Let's begin…")
-        self.update_button_state(True)
         self.set_expression("asking")
         self.next_question()
 
@@ -198,29 +278,29 @@ class IndinatorGUI(QWidget):
         for b in (self.yes_btn, self.no_btn, self.skip_btn):
             b.setEnabled(active)
 
+    def set_busy(self, busy: bool):
+        # Block input while the worker owns the engine so requests can't overlap
+        self.update_button_state(not busy)
+        self.new_game_btn.setEnabled(not busy)
+
     def next_question(self):
-        q_idx = self.ai.select_best_question(focus_top_n=10)
-        if q_idx is None:
-            self.make_guess()
-            return
+        self.set_busy(True)
+        self.request_next.emit()
 
+    def show_question(self, q_idx: int, question: str):
         self.current_question_idx = q_idx
-        question = self.ai.questions[q_idx]["question"]
         self.speech_label.setText(f"❓ {question}")
         self.mode = "asking"
         self.set_expression("asking")
+        self.set_busy(False)
 
     def compute_threshold(self) -> float:
-        q = self.questions_asked
-        if q <= 5:
-            return 0.75
-        elif q <= 12:
-            return 0.65
-        elif q <= 18:
-            return 0.55
-        return 0.45
-
-    def on_answer(self, ans):
+        # Last entry covers every question count past the end of the table
+        q = min(self.questions_asked, len(GUESS_THRESHOLDS) - 1)
+        return GUESS_THRESHOLDS[q]
+
+    def on_answer(self, ans, _checked=False):
+        # _checked absorbs the bool that QPushButton.clicked passes to partial() slots
         if self.mode == "asking":
             self.handle_question_answer(ans)
         elif self.mode == "confirming":
@@ -236,21 +316,20 @@ class IndinatorGUI(QWidget):
         self.questions_asked += 1
 
         if ans is not None:
-            self.ai.update_probabilities(self.current_question_idx, bool(ans))
             self.status_label.setText(f"Questions asked: {self.questions_asked}")
         else:
             self.status_label.setText(
                 f"Skipped. Questions asked: {self.questions_asked}"
             )
 
-        threshold = self.compute_threshold()
-        if self.ai.should_make_guess(threshold=threshold):
-            self.make_guess()
-        else:
-            self.next_question()
+        self.set_busy(True)
+        self.answer_received.emit(self.current_question_idx, ans, self.compute_threshold())
 
     def make_guess(self):
-        character, prob = self.ai.get_best_guess()
+        self.set_busy(True)
+        self.request_guess.emit()
+
+    def show_guess(self, character: str, prob: float):
         self.pending_guess = (character, prob)
         self.mode = "confirming"
         self.set_expression("guessing")
@@ -263,6 +342,7 @@ class IndinatorGUI(QWidget):
             f"Am I right?"
         )
         self.status_label.setText("Confirm my guess with Yes / No / Don't know.")
+        self.set_busy(False)
 
     def handle_guess_confirmation(self, ans):
         if not self.pending_guess:
@@ -281,19 +361,12 @@ class IndinatorGUI(QWidget):
             return
 
         if ans is False:
-            # Penalize wrong guess lightly and try again
-            try:
-                self.ai.penalize_wrong_guess(character, penalty_factor=0.001)
-            except Exception:
-                pass
-
             self.set_expression("error")
             self.status_label.setText("Hmm, I was wrong. Let me think again…")
 
-            if self.questions_asked >= 25:
-                self.make_guess()
-            else:
-                self.next_question()
+            # Worker penalizes the guess, then guesses again or asks another question
+            self.set_busy(True)
+            self.wrong_guess.emit(character, self.questions_asked >= 25)
             return
 
         # Don't know / skip on guess
@@ -309,6 +382,11 @@ class IndinatorGUI(QWidget):
         )
         self.status_label.setText("Game finished.")
 
+    def closeEvent(self, event):
+        self.engine_thread.quit()
+        self.engine_thread.wait()
+        super().closeEvent(event)
+
 
 def main():
     app = QApplication(sys.argv)